@@ -1,15 +1,27 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from datetime import datetime
-import csv
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                           QTableWidget, QTableWidgetItem, QTabWidget, QLabel,
+                           QTableView, QTabWidget, QLabel,
                            QPushButton, QHeaderView, QLineEdit, QMessageBox,
                            QProgressBar, QFileDialog, QComboBox, QCheckBox,
                            QStatusBar)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel)
 from PyQt5.QtGui import QColor, QFont
 
+# Shared cell colors, constructed once instead of per data() call
+CH_ONLY_COLOR = QColor(255, 200, 200)
+IT_ONLY_COLOR = QColor(200, 255, 200)
+DIFF_ROW_COLOR = QColor(255, 255, 200)
+LINK_COLOR = QColor(0, 0, 255)
+
 def standardize_phone_number(phone):
     """Standardize phone number format to include '+1' prefix if missing"""
     try:
@@ -23,41 +35,295 @@ def standardize_phone_number(phone):
         print(f"Error standardizing phone number: {e}")
         return phone
 
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def load_call_log(path, timestamp_col):
+    """Read a call log CSV in chunks so peak memory stays bounded"""
+    wanted = ('Phone Number', timestamp_col, 'Call Type', 'Service')
+    chunks = []
+    for chunk in pd.read_csv(path, chunksize=500_000, engine='c',
+                             usecols=lambda c: c in wanted,
+                             parse_dates=[timestamp_col],
+                             date_format=TIMESTAMP_FORMAT,
+                             dtype={'Phone Number': 'string'}):
+        chunk['Phone Number'] = standardize_phone_series(chunk['Phone Number'])
+        chunks.append(chunk)
+    return pd.concat(chunks, ignore_index=True)
+
+def _standardize_phone_arrow(series):
+    """Arrow-kernel variant of standardize_phone_series"""
+    # Explicit string type: inference can give large_string, which the
+    # join kernel refuses to mix with plain-string scalar literals
+    arr = pc.utf8_trim_whitespace(pa.array(series.astype(str), type=pa.string()))
+    has_plus1 = pc.starts_with(arr, pattern='+1')
+    has_one = pc.starts_with(arr, pattern='1')
+    out = pc.if_else(has_plus1, arr,
+                     pc.if_else(has_one,
+                                pc.binary_join_element_wise('+', arr, ''),
+                                pc.binary_join_element_wise('+1', arr, '')))
+    return pd.Series(out.to_pandas().to_numpy(), index=series.index)
+
+def standardize_phone_series(series):
+    """Vectorized standardize_phone_number for a whole column"""
+    if pc is not None:
+        try:
+            return _standardize_phone_arrow(series)
+        except pa.ArrowException:
+            pass  # missing/mismatched kernel on this build; fall through
+    s = series.astype(str).str.strip()
+    has_plus1 = s.str.startswith('+1')
+    has_one = s.str.startswith('1') & ~has_plus1
+    return pd.Series(np.where(has_plus1, s, np.where(has_one, '+' + s, '+1' + s)),
+                     index=series.index)
+
+class PandasModel(QAbstractTableModel):
+    """Read-only table model exposing a pandas DataFrame to a QTableView.
+
+    Cells are served straight out of the DataFrame, so no per-cell
+    QTableWidgetItem allocations are needed.
+    """
+
+    HEADERS = None  # subclasses set display labels; falls back to df columns
+    FETCH_BATCH = 200  # rows materialized per fetchMore call
+    SEARCH_ROLE = Qt.UserRole  # case-folded row text for the filter proxy
+
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        self._df = df
+        self._loaded = min(self.FETCH_BATCH, len(df))
+        self._search_cache = None
+
+    def dataframe(self):
+        return self._df
+
+    def set_dataframe(self, df):
+        self.beginResetModel()
+        self._df = df
+        self._loaded = min(self.FETCH_BATCH, len(df))
+        self._search_cache = None
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return len(self._df) > self._loaded
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        remainder = len(self._df) - self._loaded
+        to_fetch = min(self.FETCH_BATCH, remainder)
+        if to_fetch <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + to_fetch - 1)
+        self._loaded += to_fetch
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._df.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            if self.HEADERS:
+                return self.HEADERS[section]
+            return str(self._df.columns[section])
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return self.cell_text(row, col)
+        if role == Qt.TextAlignmentRole:
+            return self.cell_alignment(col)
+        if role == Qt.BackgroundRole:
+            return self.cell_background(row, col)
+        if role == Qt.ForegroundRole:
+            return self.cell_foreground(row, col)
+        if role == Qt.FontRole:
+            return self.cell_font(row, col)
+        if role == self.SEARCH_ROLE:
+            return self.search_text(row)
+        return None
+
+    def cell_font(self, row, col):
+        return None
+
+    def search_text(self, row):
+        # Case-folded whole-row text, built once per DataFrame swap so the
+        # filter proxy doesn't lower every cell on every keystroke
+        if self._search_cache is None:
+            if len(self._df):
+                self._search_cache = (self._df.astype(str)
+                                      .agg(' '.join, axis=1).str.lower().tolist())
+            else:
+                self._search_cache = []
+        return self._search_cache[row]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Sort the DataFrame itself (NumPy sort at C speed) and reset once,
+        # instead of per-pair QVariant comparisons in the view/proxy
+        if column < 0 or not len(self._df):
+            return
+        col = self._df.columns[column]
+        self.set_dataframe(self._df.sort_values(
+            by=col, ascending=(order == Qt.AscendingOrder), kind='mergesort')
+            .reset_index(drop=True))
+
+    def cell_text(self, row, col):
+        return str(self._df.iat[row, col])
+
+    def cell_alignment(self, col):
+        return None
+
+    def cell_background(self, row, col):
+        return None
+
+    def cell_foreground(self, row, col):
+        return None
+
+class DataFrameSortProxy(QSortFilterProxyModel):
+    """Filter proxy that hands sorting to the source PandasModel."""
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+class SummaryModel(PandasModel):
+    """Model over the merged totals DataFrame (Phone Number / totals / Difference)."""
+
+    HEADERS = ["Phone Number", "Call History Total", "iTunes Total", "Difference"]
+
+    def cell_text(self, row, col):
+        value = self._df.iat[row, col]
+        if col > 0:
+            return str(int(value))
+        return str(value)
+
+    def cell_alignment(self, col):
+        if col > 0:
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+
+    _link_font = None
+
+    def cell_background(self, row, col):
+        # Highlight rows with differences
+        if self._df.iat[row, 3] > 0:
+            return DIFF_ROW_COLOR
+        return None
+
+    def cell_foreground(self, row, col):
+        # Clickable difference indicator
+        if col == 3 and self._df.iat[row, 3] > 0:
+            return LINK_COLOR
+        return None
+
+    def cell_font(self, row, col):
+        # Underline the clickable difference like a link
+        if col == 3 and self._df.iat[row, 3] > 0:
+            if SummaryModel._link_font is None:
+                font = QFont()
+                font.setUnderline(True)
+                SummaryModel._link_font = font
+            return SummaryModel._link_font
+        return None
+
+class DifferenceModel(PandasModel):
+    """Model over the per-number difference rows built by DifferenceDetailsTab."""
+
+    HEADERS = ["Date", "Call History Timestamp", "iTunes Timestamp",
+               "Call Type", "Service"]
+
+    def cell_text(self, row, col):
+        if col == 0:  # datetime64 column, show date only
+            return self._df.iat[row, col].strftime('%Y-%m-%d')
+        return str(self._df.iat[row, col])
+
+    def cell_background(self, row, col):
+        # Color-code the timestamps
+        if col == 1 and not self._df.iat[row, 2]:  # Only in Call History
+            return CH_ONLY_COLOR
+        if col == 2 and not self._df.iat[row, 1]:  # Only in iTunes
+            return IT_ONLY_COLOR
+        return None
+
+class DifferenceFilterProxy(DataFrameSortProxy):
+    """Filter proxy combining the search box with date/type/service filters.
+
+    Filtering toggles row visibility in place; no model reset and no
+    re-population of the underlying DataFrame.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.date_from = None
+        self.date_to = None
+        self.call_type = 'All'
+        self.service = 'All'
+
+    def set_filters(self, date_from, date_to, call_type, service):
+        self.date_from = date_from
+        self.date_to = date_to
+        self.call_type = call_type
+        self.service = service
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        df = self.sourceModel().dataframe()
+        if self.date_from is not None and df.iat[source_row, 0] < self.date_from:
+            return False
+        if self.date_to is not None and df.iat[source_row, 0] > self.date_to:
+            return False
+        if self.call_type != 'All' and df.iat[source_row, 3] != self.call_type:
+            return False
+        if self.service != 'All' and df.iat[source_row, 4] != self.service:
+            return False
+        return super().filterAcceptsRow(source_row, source_parent)
+
 class DifferenceDetailsTab(QWidget):
-    def __init__(self, phone_number, call_history_df, itunes_df):
+    COLUMNS = ['date', 'ch_time', 'it_time', 'call_type', 'service']
+
+    def __init__(self, phone_number, rows_df):
         super().__init__()
         self.phone_number = phone_number
-        self.call_history_df = call_history_df
-        self.itunes_df = itunes_df
+        self.rows_df = rows_df
         self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout()
-        
+
         # Create header and controls
         header_layout = QHBoxLayout()
-        
+
         # Create header label
         header = QLabel(f"Call Differences for {self.phone_number}")
         header.setStyleSheet("font-size: 14px; font-weight: bold;")
         header_layout.addWidget(header)
-        
-        # Add search box
+
+        # Add search box (debounced so only the final keystroke filters)
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search...")
-        self.search_box.textChanged.connect(self.filter_table)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.filter_table)
+        self.search_box.textChanged.connect(self._search_timer.start)
         header_layout.addWidget(self.search_box)
-        
+
         # Add export button
         export_btn = QPushButton("Export to CSV")
         export_btn.clicked.connect(self.export_to_csv)
         header_layout.addWidget(export_btn)
-        
+
         layout.addLayout(header_layout)
 
         # Create filter controls
         filter_layout = QHBoxLayout()
-        
+
         # Date range filter
         self.date_from = QLineEdit()
         self.date_from.setPlaceholderText("Date From (YYYY-MM-DD)")
@@ -66,154 +332,85 @@ class DifferenceDetailsTab(QWidget):
         filter_layout.addWidget(QLabel("Date Range:"))
         filter_layout.addWidget(self.date_from)
         filter_layout.addWidget(self.date_to)
-        
+
         # Call type filter
         self.call_type_filter = QComboBox()
         self.call_type_filter.addItems(['All', 'Incoming', 'Outgoing', 'Missed'])
         filter_layout.addWidget(QLabel("Call Type:"))
         filter_layout.addWidget(self.call_type_filter)
-        
+
         # Service filter
         self.service_filter = QComboBox()
         self.service_filter.addItems(['All', 'Phone', 'FaceTime', 'FaceTime Video'])
         filter_layout.addWidget(QLabel("Service:"))
         filter_layout.addWidget(self.service_filter)
-        
+
         # Apply filters button
         apply_filters_btn = QPushButton("Apply Filters")
         apply_filters_btn.clicked.connect(self.apply_filters)
         filter_layout.addWidget(apply_filters_btn)
-        
+
         layout.addLayout(filter_layout)
 
-        # Create table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "Date", 
-            "Call History Timestamp", 
-            "iTunes Timestamp",
-            "Call Type",
-            "Service"
-        ])
-        
-        self.load_table_data()
-        
+        # Create table view backed by a DataFrame model + filter proxy
+        self.table = QTableView()
+        self.model = DifferenceModel(pd.DataFrame(columns=self.COLUMNS))
+        self.proxy = DifferenceFilterProxy()
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy.setFilterRole(PandasModel.SEARCH_ROLE)
+        self.proxy.setFilterKeyColumn(0)  # search role covers the whole row
+        self.table.setModel(self.proxy)
+
+        # Fetch further row batches as the user scrolls
+        self.table.verticalScrollBar().valueChanged.connect(self._maybe_fetch_more)
+
+        self.populate_table(self.rows_df)
+
         # Set table properties
         header = self.table.horizontalHeader()
         for i in range(5):
             header.setSectionResizeMode(i, QHeaderView.Stretch)
-        
-        # Enable sorting
+
+        # Enable sorting (handled by the proxy)
         self.table.setSortingEnabled(True)
-        
+
         # Add status bar
         self.status_bar = QStatusBar()
         self.update_status_bar()
-        
+
         layout.addWidget(self.table)
         layout.addWidget(self.status_bar)
         self.setLayout(layout)
 
-    def load_table_data(self):
+    def populate_table(self, rows_df):
+        # Swap the backing DataFrame with view updates suspended so the
+        # reset triggers a single repaint
+        self.table.setUpdatesEnabled(False)
         try:
-            # Filter data for this phone number
-            ch_calls = self.call_history_df[self.call_history_df['Phone Number'] == self.phone_number]
-            it_calls = self.itunes_df[self.itunes_df['Phone Number'] == self.phone_number]
-            
-            # Get all timestamps from both sources
-            ch_times = set(ch_calls['Call Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S'))
-            it_times = set(it_calls['Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S'))
-            
-            # Find differences
-            ch_only = ch_times - it_times
-            it_only = it_times - ch_times
-            
-            # Prepare data for display
-            self.rows = []
-            
-            # Add calls only in Call History
-            for time in sorted(ch_only):
-                call = ch_calls[ch_calls['Call Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S') == time].iloc[0]
-                self.rows.append({
-                    'date': time[:10],
-                    'ch_time': time,
-                    'it_time': '',
-                    'call_type': call.get('Call Type', 'N/A'),
-                    'service': call.get('Service', 'N/A')
-                })
-            
-            # Add calls only in iTunes
-            for time in sorted(it_only):
-                call = it_calls[it_calls['Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S') == time].iloc[0]
-                self.rows.append({
-                    'date': time[:10],
-                    'ch_time': '',
-                    'it_time': time,
-                    'call_type': call.get('Call Type', 'N/A'),
-                    'service': call.get('Service', 'N/A')
-                })
-            
-            self.populate_table(self.rows)
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error loading data: {str(e)}")
-
-    def populate_table(self, rows):
-        self.table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            self.table.setItem(i, 0, QTableWidgetItem(row['date']))
-            
-            # Color-code the timestamps
-            ch_time_item = QTableWidgetItem(row['ch_time'])
-            it_time_item = QTableWidgetItem(row['it_time'])
-            
-            if not row['it_time']:  # Only in Call History
-                ch_time_item.setBackground(QColor(255, 200, 200))
-            if not row['ch_time']:  # Only in iTunes
-                it_time_item.setBackground(QColor(200, 255, 200))
-                
-            self.table.setItem(i, 1, ch_time_item)
-            self.table.setItem(i, 2, it_time_item)
-            self.table.setItem(i, 3, QTableWidgetItem(row['call_type']))
-            self.table.setItem(i, 4, QTableWidgetItem(row['service']))
+            self.model.set_dataframe(rows_df.reset_index(drop=True))
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def _maybe_fetch_more(self, value):
+        if value >= self.table.verticalScrollBar().maximum() and self.model.canFetchMore():
+            self.model.fetchMore()
 
     def filter_table(self):
-        search_text = self.search_box.text().lower()
-        for row in range(self.table.rowCount()):
-            show_row = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and search_text in item.text().lower():
-                    show_row = True
-                    break
-            self.table.setRowHidden(row, not show_row)
+        self.proxy.setFilterFixedString(self.search_box.text())
         self.update_status_bar()
 
     def apply_filters(self):
         try:
-            filtered_rows = self.rows.copy()
-            
-            # Apply date range filter
-            if self.date_from.text():
-                date_from = datetime.strptime(self.date_from.text(), '%Y-%m-%d')
-                filtered_rows = [row for row in filtered_rows if datetime.strptime(row['date'], '%Y-%m-%d') >= date_from]
-            
-            if self.date_to.text():
-                date_to = datetime.strptime(self.date_to.text(), '%Y-%m-%d')
-                filtered_rows = [row for row in filtered_rows if datetime.strptime(row['date'], '%Y-%m-%d') <= date_to]
-            
-            # Apply call type filter
-            if self.call_type_filter.currentText() != 'All':
-                filtered_rows = [row for row in filtered_rows if row['call_type'] == self.call_type_filter.currentText()]
-            
-            # Apply service filter
-            if self.service_filter.currentText() != 'All':
-                filtered_rows = [row for row in filtered_rows if row['service'] == self.service_filter.currentText()]
-            
-            self.populate_table(filtered_rows)
+            # Hand the parsed filters to the proxy; rows are hidden or
+            # shown in place without rebuilding the model
+            date_from = pd.Timestamp(self.date_from.text()) if self.date_from.text() else None
+            date_to = pd.Timestamp(self.date_to.text()) if self.date_to.text() else None
+            self.proxy.set_filters(date_from, date_to,
+                                   self.call_type_filter.currentText(),
+                                   self.service_filter.currentText())
             self.update_status_bar()
-            
+
         except ValueError as e:
             QMessageBox.warning(self, "Invalid Date", "Please enter dates in YYYY-MM-DD format")
         except Exception as e:
@@ -224,32 +421,35 @@ class DifferenceDetailsTab(QWidget):
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export to CSV", "", "CSV Files (*.csv)")
             if filename:
-                with open(filename, 'w', newline='') as file:
-                    writer = csv.writer(file)
-                    # Write headers
-                    headers = []
-                    for i in range(self.table.columnCount()):
-                        headers.append(self.table.horizontalHeaderItem(i).text())
-                    writer.writerow(headers)
-                    
-                    # Write visible rows
-                    for row in range(self.table.rowCount()):
-                        if not self.table.isRowHidden(row):
-                            row_data = []
-                            for col in range(self.table.columnCount()):
-                                item = self.table.item(row, col)
-                                row_data.append(item.text() if item else "")
-                            writer.writerow(row_data)
-                            
+                # Export straight from the backing DataFrame, applying the
+                # proxy's filter state plus the search box so the CSV
+                # matches exactly what the table shows
+                df = self.model.dataframe()
+                mask = pd.Series(True, index=df.index)
+                if self.proxy.date_from is not None:
+                    mask &= df['date'] >= self.proxy.date_from
+                if self.proxy.date_to is not None:
+                    mask &= df['date'] <= self.proxy.date_to
+                if self.proxy.call_type != 'All':
+                    mask &= df['call_type'] == self.proxy.call_type
+                if self.proxy.service != 'All':
+                    mask &= df['service'] == self.proxy.service
+                df = df[mask]
+                text = self.search_box.text().strip().lower()
+                if text:
+                    row_text = df.astype(str).agg(' '.join, axis=1).str.lower()
+                    df = df[row_text.str.contains(text, regex=False)]
+                df.to_csv(filename, index=False, header=DifferenceModel.HEADERS,
+                          date_format='%Y-%m-%d')
+
                 QMessageBox.information(self, "Success", "Data exported successfully!")
-                
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error exporting data: {str(e)}")
 
     def update_status_bar(self):
-        visible_rows = sum(1 for row in range(self.table.rowCount()) 
-                         if not self.table.isRowHidden(row))
-        total_rows = self.table.rowCount()
+        visible_rows = self.proxy.rowCount()
+        total_rows = len(self.model.dataframe())
         self.status_bar.showMessage(f"Showing {visible_rows} of {total_rows} differences")
 
 class MainWindow(QMainWindow):
@@ -257,7 +457,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Call History Comparison")
         self.setGeometry(100, 100, 1200, 800)
-        
+
         try:
             self.init_data()
             self.init_ui()
@@ -265,32 +465,94 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Error initializing application: {str(e)}")
             sys.exit(1)
 
+    def compute_diff(self, phone_number):
+        """Build the difference rows for one phone number, memoized per load"""
+        cached = self._diff_cache.get(phone_number)
+        if cached is not None:
+            return cached
+
+        # Look up this phone number via the index (list-wrapped so a
+        # single-row result still comes back as a DataFrame)
+        ch_calls = (self.call_history.loc[[phone_number]]
+                    if phone_number in self.call_history.index
+                    else self.call_history.iloc[0:0])
+        it_calls = (self.itunes_calls.loc[[phone_number]]
+                    if phone_number in self.itunes_calls.index
+                    else self.itunes_calls.iloc[0:0])
+
+        # Second-resolution timestamp keys for the comparison
+        ch_calls = ch_calls.assign(ts=ch_calls['Call Timestamp'].dt.floor('s'))
+        it_calls = it_calls.assign(ts=it_calls['Timestamp'].dt.floor('s'))
+
+        # Anti-join each side against the other's timestamps
+        ch_only = (ch_calls.drop_duplicates(subset='ts')
+                   .merge(it_calls[['ts']].drop_duplicates(), on='ts',
+                          how='left', indicator=True)
+                   .query('_merge == "left_only"')
+                   .sort_values('ts'))
+        it_only = (it_calls.drop_duplicates(subset='ts')
+                   .merge(ch_calls[['ts']].drop_duplicates(), on='ts',
+                          how='left', indicator=True)
+                   .query('_merge == "left_only"')
+                   .sort_values('ts'))
+
+        # Build display rows with vectorized column assignment; 'date'
+        # stays datetime64 so filters compare natively instead of
+        # re-parsing strings
+        ch_rows = pd.DataFrame({
+            'date': ch_only['ts'].dt.normalize(),
+            'ch_time': ch_only['ts'].dt.strftime('%Y-%m-%d %H:%M:%S'),
+            'it_time': '',
+            'call_type': ch_only.get('Call Type', 'N/A'),
+            'service': ch_only.get('Service', 'N/A')
+        })
+        it_rows = pd.DataFrame({
+            'date': it_only['ts'].dt.normalize(),
+            'ch_time': '',
+            'it_time': it_only['ts'].dt.strftime('%Y-%m-%d %H:%M:%S'),
+            'call_type': it_only.get('Call Type', 'N/A'),
+            'service': it_only.get('Service', 'N/A')
+        })
+
+        rows_df = pd.concat([ch_rows, it_rows], ignore_index=True)
+        self._diff_cache[phone_number] = rows_df
+        return rows_df
+
     def init_data(self):
         try:
-            # Read the CSV files
-            self.call_history = pd.read_csv('call_history.csv')
-            self.itunes_calls = pd.read_csv('itunes-calls.csv')
-
-            # Standardize phone numbers
-            self.call_history['Phone Number'] = self.call_history['Phone Number'].apply(standardize_phone_number)
-            self.itunes_calls['Phone Number'] = self.itunes_calls['Phone Number'].apply(standardize_phone_number)
-
-            # Convert timestamps
-            self.call_history['Call Timestamp'] = pd.to_datetime(self.call_history['Call Timestamp'])
-            self.itunes_calls['Timestamp'] = pd.to_datetime(self.itunes_calls['Timestamp'])
-
-            # Calculate total calls per number
-            self.ch_totals = self.call_history.groupby('Phone Number').size()
-            self.it_totals = self.itunes_calls.groupby('Phone Number').size()
-            
-            # Merge totals
-            self.merged_totals = pd.DataFrame({
-                'Call History': self.ch_totals,
-                'iTunes': self.it_totals
-            }).fillna(0)
-            self.merged_totals['Difference'] = abs(
+            # Invalidate memoized diffs whenever the source data reloads
+            self._diff_cache = {}
+
+            # Read the CSV files chunk-wise, standardizing as we go
+            # The two files are independent and the C parser releases the
+            # GIL, so read them on parallel threads
+            with ThreadPoolExecutor(2) as ex:
+                fut_ch = ex.submit(load_call_log, 'call_history.csv', 'Call Timestamp')
+                fut_it = ex.submit(load_call_log, 'itunes-calls.csv', 'Timestamp')
+                self.call_history = fut_ch.result()
+                self.itunes_calls = fut_it.result()
+
+            # Categorical storage: these columns repeat few unique values,
+            # so codes beat strings for memory and comparisons
+            for df in (self.call_history, self.itunes_calls):
+                for col in ('Phone Number', 'Call Type', 'Service'):
+                    if col in df.columns:
+                        df[col] = df[col].astype('category')
+
+            # Index by phone number so per-number lookups avoid full column scans
+            self.call_history = self.call_history.set_index('Phone Number', drop=False).sort_index()
+            self.itunes_calls = self.itunes_calls.set_index('Phone Number', drop=False).sort_index()
+
+            # Calculate total calls per number; value_counts beats
+            # groupby().size() and one concat aligns both sides
+            ch_totals = self.call_history['Phone Number'].value_counts(sort=False)
+            it_totals = self.itunes_calls['Phone Number'].value_counts(sort=False)
+            self.merged_totals = (pd.concat([ch_totals, it_totals], axis=1,
+                                            keys=['Call History', 'iTunes'])
+                                  .fillna(0).astype('int64').sort_index())
+            self.merged_totals['Difference'] = (
                 self.merged_totals['Call History'] - self.merged_totals['iTunes']
-            )
+            ).abs()
         except Exception as e:
             raise Exception(f"Error loading data: {str(e)}")
 
@@ -302,23 +564,27 @@ class MainWindow(QMainWindow):
 
         # Add controls at the top
         controls_layout = QHBoxLayout()
-        
-        # Add search box
+
+        # Add search box (debounced so only the final keystroke filters)
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search phone numbers...")
-        self.search_box.textChanged.connect(self.filter_main_table)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.filter_main_table)
+        self.search_box.textChanged.connect(self._search_timer.start)
         controls_layout.addWidget(self.search_box)
-        
+
         # Add refresh button
         refresh_btn = QPushButton("Refresh Data")
         refresh_btn.clicked.connect(self.refresh_data)
         controls_layout.addWidget(refresh_btn)
-        
+
         # Add export button
         export_btn = QPushButton("Export Summary")
         export_btn.clicked.connect(self.export_summary)
         controls_layout.addWidget(export_btn)
-        
+
         layout.addLayout(controls_layout)
 
         # Create tab widget
@@ -326,20 +592,27 @@ class MainWindow(QMainWindow):
         self.tab_widget.setTabsClosable(True)
         self.tab_widget.tabCloseRequested.connect(self.close_tab)
 
-        # Create main summary table
-        self.summary_table = QTableWidget()
-        self.summary_table.setColumnCount(4)
-        self.summary_table.setHorizontalHeaderLabels(
-            ["Phone Number", "Call History Total", "iTunes Total", "Difference"]
-        )
+        # Create main summary table backed by the merged totals DataFrame
+        self.summary_table = QTableView()
+        self.summary_model = SummaryModel(self.merged_totals.reset_index())
+        self.summary_proxy = DataFrameSortProxy()
+        self.summary_proxy.setSourceModel(self.summary_model)
+        self.summary_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.summary_proxy.setFilterRole(PandasModel.SEARCH_ROLE)
+        self.summary_proxy.setFilterKeyColumn(0)  # search role covers the whole row
+        self.summary_table.setModel(self.summary_proxy)
 
-        self.populate_summary_table()
+        # Fetch further row batches as the user scrolls
+        self.summary_table.verticalScrollBar().valueChanged.connect(self._maybe_fetch_more)
+
+        # Clicking a highlighted difference opens the details tab
+        self.summary_table.clicked.connect(self.on_summary_clicked)
 
         # Set table properties
         header = self.summary_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         header.setSortIndicatorShown(True)
-        header.sectionClicked.connect(self.sort_table)
+        self.summary_table.setSortingEnabled(True)
 
         # Add status bar
         self.status_bar = QStatusBar()
@@ -353,55 +626,30 @@ class MainWindow(QMainWindow):
 
     def populate_summary_table(self):
         try:
-            self.summary_table.setRowCount(len(self.merged_totals))
-            for i, (number, row) in enumerate(self.merged_totals.iterrows()):
-                # Phone number
-                number_item = QTableWidgetItem(number)
-                self.summary_table.setItem(i, 0, number_item)
-                
-                # Call history total
-                ch_total = QTableWidgetItem(str(int(row['Call History'])))
-                ch_total.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.summary_table.setItem(i, 1, ch_total)
-                
-                # iTunes total
-                it_total = QTableWidgetItem(str(int(row['iTunes'])))
-                it_total.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.summary_table.setItem(i, 2, it_total)
-                
-                # Difference (clickable)
-                if row['Difference'] > 0:
-                    diff_btn = QPushButton(str(int(row['Difference'])))
-                    diff_btn.clicked.connect(lambda checked, num=number: self.show_difference_details(num))
-                    self.summary_table.setCellWidget(i, 3, diff_btn)
-                    # Highlight rows with differences
-                    for col in range(4):
-                        item = self.summary_table.item(i, col)
-                        if item:
-                            item.setBackground(QColor(255, 255, 200))
-                else:
-                    diff_item = QTableWidgetItem('0')
-                    diff_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    self.summary_table.setItem(i, 3, diff_item)
+            # Suspend view updates so the model reset triggers one repaint
+            self.summary_table.setUpdatesEnabled(False)
+            try:
+                self.summary_model.set_dataframe(self.merged_totals.reset_index())
+            finally:
+                self.summary_table.setUpdatesEnabled(True)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error populating summary table: {str(e)}")
 
+    def _maybe_fetch_more(self, value):
+        scrollbar = self.summary_table.verticalScrollBar()
+        if value >= scrollbar.maximum() and self.summary_model.canFetchMore():
+            self.summary_model.fetchMore()
+
     def filter_main_table(self):
-        search_text = self.search_box.text().lower()
-        for row in range(self.summary_table.rowCount()):
-            show_row = False
-            for col in range(self.summary_table.columnCount()):
-                item = self.summary_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    show_row = True
-                    break
-            self.summary_table.setRowHidden(row, not show_row)
+        self.summary_proxy.setFilterFixedString(self.search_box.text())
         self.update_status_bar()
 
-    def sort_table(self, column):
-        self.summary_table.sortItems(column, 
-            Qt.AscendingOrder if self.summary_table.horizontalHeader().sortIndicatorOrder() == Qt.DescendingOrder 
-            else Qt.DescendingOrder)
+    def on_summary_clicked(self, index):
+        # Only the Difference column is clickable, and only when non-zero
+        source_index = self.summary_proxy.mapToSource(index)
+        df = self.summary_model.dataframe()
+        if index.column() == 3 and df.iat[source_index.row(), 3] > 0:
+            self.show_difference_details(df.iat[source_index.row(), 0])
 
     def show_difference_details(self, phone_number):
         # Check if tab already exists
@@ -412,7 +660,7 @@ class MainWindow(QMainWindow):
 
         # Create new tab
         try:
-            diff_tab = DifferenceDetailsTab(phone_number, self.call_history, self.itunes_calls)
+            diff_tab = DifferenceDetailsTab(phone_number, self.compute_diff(phone_number))
             self.tab_widget.addTab(diff_tab, phone_number)
             self.tab_widget.setCurrentWidget(diff_tab)
         except Exception as e:
@@ -434,41 +682,24 @@ class MainWindow(QMainWindow):
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export Summary to CSV", "", "CSV Files (*.csv)")
             if filename:
-                with open(filename, 'w', newline='') as file:
-                    writer = csv.writer(file)
-                    # Write headers
-                    headers = []
-                    for i in range(self.summary_table.columnCount()):
-                        headers.append(self.summary_table.horizontalHeaderItem(i).text())
-                    writer.writerow(headers)
-                    
-                    # Write visible rows
-                    for row in range(self.summary_table.rowCount()):
-                        if not self.summary_table.isRowHidden(row):
-                            row_data = []
-                            for col in range(self.summary_table.columnCount()):
-                                item = self.summary_table.item(row, col)
-                                if item:
-                                    row_data.append(item.text())
-                                else:
-                                    widget = self.summary_table.cellWidget(row, col)
-                                    if isinstance(widget, QPushButton):
-                                        row_data.append(widget.text())
-                                    else:
-                                        row_data.append("")
-                            writer.writerow(row_data)
-                            
+                # Export straight from the backing DataFrame, applying the
+                # current search filter if one is active
+                df = self.summary_model.dataframe()
+                text = self.search_box.text().strip().lower()
+                if text:
+                    row_text = df.astype(str).agg(' '.join, axis=1).str.lower()
+                    df = df[row_text.str.contains(text, regex=False)]
+                df.to_csv(filename, index=False, header=SummaryModel.HEADERS)
+
                 QMessageBox.information(self, "Success", "Summary exported successfully!")
-                
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error exporting summary: {str(e)}")
 
     def update_status_bar(self):
-        visible_rows = sum(1 for row in range(self.summary_table.rowCount()) 
-                         if not self.summary_table.isRowHidden(row))
-        total_rows = self.summary_table.rowCount()
-        total_differences = sum(1 for row in range(self.summary_table.rowCount())
-                              if self.summary_table.cellWidget(row, 3) is not None)
+        visible_rows = self.summary_proxy.rowCount()
+        total_rows = len(self.summary_model.dataframe())
+        total_differences = int((self.merged_totals['Difference'] > 0).sum())
         self.status_bar.showMessage(
             f"Showing {visible_rows} of {total_rows} numbers | {total_differences} numbers with differences")
 
@@ -480,4 +711,4 @@ if __name__ == '__main__':
         sys.exit(app.exec_())
     except Exception as e:
         print(f"Critical error: {str(e)}")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1)
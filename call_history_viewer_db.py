@@ -2,19 +2,253 @@ import sys
 import sqlite3
 from datetime import datetime
 import csv
+import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                           QTableWidget, QTableWidgetItem, QTabWidget, QLabel,
+                           QTableWidget, QTableWidgetItem, QTableView, QTabWidget, QLabel,
                            QPushButton, QHeaderView, QLineEdit, QMessageBox,
                            QProgressBar, QFileDialog, QComboBox, QCheckBox,
                            QStatusBar)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel)
 from PyQt5.QtGui import QColor, QFont
 
+# Shared cell colors/alignment, allocated once instead of per cell
+CH_ONLY_BG = QColor(255, 200, 200)
+IT_ONLY_BG = QColor(200, 255, 200)
+DIFF_ROW_BG = QColor(255, 255, 200)
+LINK_FG = QColor(0, 0, 255)
+RIGHT_ALIGN = Qt.AlignRight | Qt.AlignVCenter
+
+# One-shot diff: each side anti-joined against the other (SQLite's
+# FULL OUTER JOIN substitute), returning only mismatched rows already
+# tagged by which side they came from.
+DIFF_QUERY = '''
+    SELECT * FROM (
+        SELECT date(a.timestamp) AS call_date, a.timestamp AS ch_time,
+               NULL AS it_time, a.call_type, a.service
+        FROM call_history a
+        LEFT JOIN call_history b
+            ON b.timestamp = a.timestamp
+            AND b.phone_number = ? AND b.source = ?
+        WHERE a.phone_number = ? AND a.source = ?
+            AND b.timestamp IS NULL
+        UNION ALL
+        SELECT date(b.timestamp) AS call_date, NULL AS ch_time,
+               b.timestamp AS it_time, b.call_type, b.service
+        FROM call_history b
+        LEFT JOIN call_history a
+            ON a.timestamp = b.timestamp
+            AND a.phone_number = ? AND a.source = ?
+        WHERE b.phone_number = ? AND b.source = ?
+            AND a.timestamp IS NULL
+    )
+    ORDER BY (ch_time IS NULL), ch_time, it_time
+'''
+
+def diff_query_params(phone_number):
+    """Bind values for DIFF_QUERY; only the phone number varies per call"""
+    return (phone_number, 'itunes', phone_number, 'call_history',
+            phone_number, 'call_history', phone_number, 'itunes')
+
+class DiffModel(QAbstractTableModel):
+    """Table model over the diff rows as a list of 5-tuples.
+
+    Serves cells straight from the tuples and keeps a lowercase search
+    string per row for the filter proxy. Rows are exposed to the view in
+    batches via canFetchMore/fetchMore so opening a tab with tens of
+    thousands of diffs stays fast.
+    """
+
+    HEADERS = ["Date", "Call History Timestamp", "iTunes Timestamp",
+               "Call Type", "Service"]
+    FETCH_BATCH = 500
+
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self._rows = rows if rows is not None else []
+        self._search = self._build_search(self._rows)
+        self._loaded = min(self.FETCH_BATCH, len(self._rows))
+
+    @staticmethod
+    def _build_search(rows):
+        return [' '.join(str(v) for v in row).lower() for row in rows]
+
+    def rows(self):
+        return self._rows
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._search = self._build_search(rows)
+        self._loaded = min(self.FETCH_BATCH, len(rows))
+        self.endResetModel()
+
+    def search_text(self, row):
+        return self._search[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        remaining = len(self._rows) - self._loaded
+        count = min(self.FETCH_BATCH, remaining)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            return str(row[col])
+        if role == Qt.BackgroundRole:
+            # Color-code the timestamps
+            if col == 1 and not row[2]:  # Only in Call History
+                return CH_ONLY_BG
+            if col == 2 and not row[1]:  # Only in iTunes
+                return IT_ONLY_BG
+        return None
+
+class DiffFilterProxy(QSortFilterProxyModel):
+    """Proxy filtering against the model's cached lowercase row text."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ''
+
+    def set_search(self, text):
+        self._needle = text.lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._needle:
+            return True
+        return self._needle in self.sourceModel().search_text(source_row)
+
+class SummarySortProxy(DiffFilterProxy):
+    """Hands sorting to SummaryModel's argsort instead of Qt's comparator."""
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+class SummaryModel(QAbstractTableModel):
+    """Table model over the call_summary rows as typed 5-tuples.
+
+    Each row is (phone, contact, ch_total, it_total, diff) with the counts
+    kept as ints so sorting compares native values, not item text.
+    """
+
+    HEADERS = ["Phone Number", "Call History Total", "iTunes Total", "Difference"]
+
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self._rows = rows if rows is not None else []
+        self._search = self._build_search(self._rows)
+        self._keys = self._build_keys(self._rows)
+
+    @staticmethod
+    def _build_search(rows):
+        return [' '.join(str(v) for v in row).lower() for row in rows]
+
+    @staticmethod
+    def _build_keys(rows):
+        # Per-column sort keys: phones as objects, counts as native ints,
+        # so sorting runs as a C argsort instead of Python comparisons
+        if not rows:
+            return {}
+        phones, _, ch_totals, it_totals, diffs = zip(*rows)
+        return {0: np.array(phones, dtype=object),
+                1: np.array(ch_totals, dtype=np.int64),
+                2: np.array(it_totals, dtype=np.int64),
+                3: np.array(diffs, dtype=np.int64)}
+
+    def rows(self):
+        return self._rows
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._search = self._build_search(rows)
+        self._keys = self._build_keys(rows)
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column not in self._keys:
+            return
+        idx = np.argsort(self._keys[column], kind='stable')
+        if order == Qt.DescendingOrder:
+            idx = idx[::-1]
+        self.beginResetModel()
+        self._rows = [self._rows[i] for i in idx]
+        self._search = [self._search[i] for i in idx]
+        self._keys = {col: keys[idx] for col, keys in self._keys.items()}
+        self.endResetModel()
+
+    def search_text(self, row):
+        return self._search[row]
+
+    def phone_at(self, row):
+        return self._rows[row][0]
+
+    def diff_at(self, row):
+        return self._rows[row][4]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        phone, contact, ch_total, it_total, diff = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return f"{contact} ({phone})" if contact else phone
+            return str((ch_total, it_total, diff)[col - 1])
+        if role == Qt.EditRole:  # raw typed values for sorting
+            if col == 0:
+                return phone
+            return (ch_total, it_total, diff)[col - 1]
+        if role == Qt.TextAlignmentRole and col > 0:
+            return RIGHT_ALIGN
+        if role == Qt.BackgroundRole and diff > 0:
+            # Highlight rows with differences
+            return DIFF_ROW_BG
+        if role == Qt.ForegroundRole and col == 3 and diff > 0:
+            # Clickable difference indicator
+            return LINK_FG
+        return None
+
 class DifferenceDetailsTab(QWidget):
-    def __init__(self, phone_number, db_path='call_history.db'):
+    def __init__(self, phone_number, conn):
         super().__init__()
         self.phone_number = phone_number
-        self.db_path = db_path
+        self.conn = conn
         self.init_ui()
 
     def init_ui(self):
@@ -72,25 +306,21 @@ class DifferenceDetailsTab(QWidget):
         
         layout.addLayout(filter_layout)
 
-        # Create table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "Date", 
-            "Call History Timestamp", 
-            "iTunes Timestamp",
-            "Call Type",
-            "Service"
-        ])
-        
+        # Create table view backed by the diff model + filter proxy
+        self.table = QTableView()
+        self.model = DiffModel()
+        self.proxy = DiffFilterProxy()
+        self.proxy.setSourceModel(self.model)
+        self.table.setModel(self.proxy)
+
         self.load_table_data()
-        
+
         # Set table properties
         header = self.table.horizontalHeader()
         for i in range(5):
             header.setSectionResizeMode(i, QHeaderView.Stretch)
-        
-        # Enable sorting
+
+        # Enable sorting (handled by the proxy)
         self.table.setSortingEnabled(True)
         
         # Add status bar
@@ -103,115 +333,62 @@ class DifferenceDetailsTab(QWidget):
 
     def load_table_data(self):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get call history records
-            cursor.execute('''
-                SELECT date(timestamp), timestamp, call_type, service
-                FROM call_history 
-                WHERE phone_number = ? AND source = 'call_history'
-                ORDER BY timestamp
-            ''', (self.phone_number,))
-            ch_calls = {row[1]: row for row in cursor.fetchall()}
-            
-            # Get iTunes records
-            cursor.execute('''
-                SELECT date(timestamp), timestamp, call_type, service
-                FROM call_history 
-                WHERE phone_number = ? AND source = 'itunes'
-                ORDER BY timestamp
-            ''', (self.phone_number,))
-            it_calls = {row[1]: row for row in cursor.fetchall()}
-            
-            # Find differences
-            ch_only = set(ch_calls.keys()) - set(it_calls.keys())
-            it_only = set(it_calls.keys()) - set(ch_calls.keys())
-            
-            # Prepare data for display
-            self.rows = []
-            
-            # Add calls only in Call History
-            for timestamp in sorted(ch_only):
-                call = ch_calls[timestamp]
-                self.rows.append({
-                    'date': call[0],
-                    'ch_time': timestamp,
-                    'it_time': '',
-                    'call_type': call[2],
-                    'service': call[3]
-                })
-            
-            # Add calls only in iTunes
-            for timestamp in sorted(it_only):
-                call = it_calls[timestamp]
-                self.rows.append({
-                    'date': call[0],
-                    'ch_time': '',
-                    'it_time': timestamp,
-                    'call_type': call[2],
-                    'service': call[3]
-                })
-            
+            cursor = self.conn.cursor()
+
+            # Both sides diffed in one indexed query; no Python set math
+            cursor.execute(DIFF_QUERY, diff_query_params(self.phone_number))
+
+            self.rows = [(row[0], row[1] or '', row[2] or '', row[3], row[4])
+                         for row in cursor.fetchall()]
+
+            # Columnar (SoA) copies for vectorized filtering
+            names = ('date', 'ch_time', 'it_time', 'call_type', 'service')
+            if self.rows:
+                self._cols = {name: np.array(col, dtype=object)
+                              for name, col in zip(names, zip(*self.rows))}
+            else:
+                self._cols = {name: np.empty(0, dtype=object) for name in names}
+
+            # Dates parsed exactly once into datetime64 for the range filter
+            self._date_ords = self._cols['date'].astype('datetime64[D]')
+
             self.populate_table(self.rows)
-            conn.close()
-            
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error loading data: {str(e)}")
 
     def populate_table(self, rows):
-        self.table.setRowCount(len(rows))
-        for i, row in enumerate(rows):
-            self.table.setItem(i, 0, QTableWidgetItem(row['date']))
-            
-            # Color-code the timestamps
-            ch_time_item = QTableWidgetItem(row['ch_time'])
-            it_time_item = QTableWidgetItem(row['it_time'])
-            
-            if not row['it_time']:  # Only in Call History
-                ch_time_item.setBackground(QColor(255, 200, 200))
-            if not row['ch_time']:  # Only in iTunes
-                it_time_item.setBackground(QColor(200, 255, 200))
-                
-            self.table.setItem(i, 1, ch_time_item)
-            self.table.setItem(i, 2, it_time_item)
-            self.table.setItem(i, 3, QTableWidgetItem(row['call_type']))
-            self.table.setItem(i, 4, QTableWidgetItem(row['service']))
+        # Swap the backing rows with view updates suspended so the reset
+        # triggers a single repaint
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_rows(rows)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def filter_table(self):
-        search_text = self.search_box.text().lower()
-        for row in range(self.table.rowCount()):
-            show_row = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and search_text in item.text().lower():
-                    show_row = True
-                    break
-            self.table.setRowHidden(row, not show_row)
+        self.proxy.set_search(self.search_box.text())
         self.update_status_bar()
 
     def apply_filters(self):
         try:
-            filtered_rows = self.rows.copy()
-            
-            # Apply date range filter
+            # Build one boolean mask over the columnar arrays; the filter
+            # box strings are parsed once, never the rows
+            mask = np.ones(len(self.rows), dtype=bool)
+
             if self.date_from.text():
-                date_from = datetime.strptime(self.date_from.text(), '%Y-%m-%d')
-                filtered_rows = [row for row in filtered_rows if datetime.strptime(row['date'], '%Y-%m-%d') >= date_from]
-            
+                mask &= self._date_ords >= np.datetime64(self.date_from.text())
+
             if self.date_to.text():
-                date_to = datetime.strptime(self.date_to.text(), '%Y-%m-%d')
-                filtered_rows = [row for row in filtered_rows if datetime.strptime(row['date'], '%Y-%m-%d') <= date_to]
-            
-            # Apply call type filter
+                mask &= self._date_ords <= np.datetime64(self.date_to.text())
+
             if self.call_type_filter.currentText() != 'All':
-                filtered_rows = [row for row in filtered_rows if row['call_type'] == self.call_type_filter.currentText()]
-            
-            # Apply service filter
+                mask &= self._cols['call_type'] == self.call_type_filter.currentText()
+
             if self.service_filter.currentText() != 'All':
-                filtered_rows = [row for row in filtered_rows if row['service'] == self.service_filter.currentText()]
-            
-            self.populate_table(filtered_rows)
+                mask &= self._cols['service'] == self.service_filter.currentText()
+
+            self.populate_table([self.rows[i] for i in np.flatnonzero(mask)])
             self.update_status_bar()
             
         except ValueError as e:
@@ -224,32 +401,54 @@ class DifferenceDetailsTab(QWidget):
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export to CSV", "", "CSV Files (*.csv)")
             if filename:
-                with open(filename, 'w', newline='') as file:
+                # Re-run the diff query with the current filter state as SQL
+                # predicates and stream the cursor straight into the writer
+                conditions = []
+                params = list(diff_query_params(self.phone_number))
+
+                if self.date_from.text():
+                    conditions.append('call_date >= ?')
+                    params.append(self.date_from.text())
+                if self.date_to.text():
+                    conditions.append('call_date <= ?')
+                    params.append(self.date_to.text())
+                if self.call_type_filter.currentText() != 'All':
+                    conditions.append('call_type = ?')
+                    params.append(self.call_type_filter.currentText())
+                if self.service_filter.currentText() != 'All':
+                    conditions.append('service = ?')
+                    params.append(self.service_filter.currentText())
+                search = self.search_box.text().strip()
+                if search:
+                    conditions.append('''(call_date LIKE ? OR IFNULL(ch_time, '') LIKE ?
+                        OR IFNULL(it_time, '') LIKE ? OR call_type LIKE ? OR service LIKE ?)''')
+                    params.extend([f'%{search}%'] * 5)
+
+                query = f'SELECT * FROM ({DIFF_QUERY})'
+                if conditions:
+                    query += ' WHERE ' + ' AND '.join(conditions)
+
+                with open(filename, 'w', newline='', buffering=1 << 20) as file:
                     writer = csv.writer(file)
-                    # Write headers
-                    headers = []
-                    for i in range(self.table.columnCount()):
-                        headers.append(self.table.horizontalHeaderItem(i).text())
-                    writer.writerow(headers)
-                    
-                    # Write visible rows
-                    for row in range(self.table.rowCount()):
-                        if not self.table.isRowHidden(row):
-                            row_data = []
-                            for col in range(self.table.columnCount()):
-                                item = self.table.item(row, col)
-                                row_data.append(item.text() if item else "")
-                            writer.writerow(row_data)
-                            
+                    writer.writerow([
+                        "Date", "Call History Timestamp", "iTunes Timestamp",
+                        "Call Type", "Service"
+                    ])
+
+                    cursor = self.conn.cursor()
+                    cursor.arraysize = 1000
+                    cursor.execute(query, params)
+                    writer.writerows(cursor)
+
                 QMessageBox.information(self, "Success", "Data exported successfully!")
-                
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error exporting data: {str(e)}")
 
     def update_status_bar(self):
-        visible_rows = sum(1 for row in range(self.table.rowCount()) 
-                         if not self.table.isRowHidden(row))
-        total_rows = self.table.rowCount()
+        visible_rows = self.proxy.rowCount()
+        # rowCount() only covers the fetched batch; count the full row list
+        total_rows = len(self.model.rows())
         self.status_bar.showMessage(f"Showing {visible_rows} of {total_rows} differences")
 
 class MainWindow(QMainWindow):
@@ -258,13 +457,86 @@ class MainWindow(QMainWindow):
         self.db_path = db_path
         self.setWindowTitle("Call History Comparison")
         self.setGeometry(100, 100, 1200, 800)
-        
+
         try:
+            # One connection for the window's lifetime; every query path
+            # shares it and benefits from the statement cache
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.init_db()
             self.init_ui()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error initializing application: {str(e)}")
             sys.exit(1)
 
+    def init_db(self):
+        conn = self.conn
+
+        # Cheap-write settings; refresh is read-heavy but the triggers
+        # below add small writes per ingest
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA mmap_size=268435456')
+
+        # Composite index so both sides of the diff query are index-only scans
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS ix_ch_phone_src_ts
+            ON call_history(phone_number, source, timestamp)
+        ''')
+
+        # Materialized summary: maintained per phone number by triggers so
+        # refresh reads a small table instead of re-aggregating everything
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS call_summary_cache (
+                phone_number TEXT PRIMARY KEY,
+                contact_name TEXT,
+                call_history_count INT,
+                itunes_count INT,
+                difference INT
+            );
+
+            CREATE TRIGGER IF NOT EXISTS trg_summary_insert
+            AFTER INSERT ON call_history
+            BEGIN
+                INSERT INTO call_summary_cache
+                SELECT phone_number, MAX(contact_name),
+                       COUNT(CASE WHEN source = 'call_history' THEN 1 END),
+                       COUNT(CASE WHEN source = 'itunes' THEN 1 END),
+                       ABS(COUNT(CASE WHEN source = 'call_history' THEN 1 END) -
+                           COUNT(CASE WHEN source = 'itunes' THEN 1 END))
+                FROM call_history WHERE phone_number = NEW.phone_number
+                GROUP BY phone_number
+                ON CONFLICT(phone_number) DO UPDATE SET
+                    contact_name = excluded.contact_name,
+                    call_history_count = excluded.call_history_count,
+                    itunes_count = excluded.itunes_count,
+                    difference = excluded.difference;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_summary_delete
+            AFTER DELETE ON call_history
+            BEGIN
+                DELETE FROM call_summary_cache
+                WHERE phone_number = OLD.phone_number;
+                INSERT INTO call_summary_cache
+                SELECT phone_number, MAX(contact_name),
+                       COUNT(CASE WHEN source = 'call_history' THEN 1 END),
+                       COUNT(CASE WHEN source = 'itunes' THEN 1 END),
+                       ABS(COUNT(CASE WHEN source = 'call_history' THEN 1 END) -
+                           COUNT(CASE WHEN source = 'itunes' THEN 1 END))
+                FROM call_history WHERE phone_number = OLD.phone_number
+                GROUP BY phone_number;
+            END;
+        ''')
+
+        # Seed the cache from the aggregating view on first run
+        count = conn.execute('SELECT COUNT(*) FROM call_summary_cache').fetchone()[0]
+        if count == 0:
+            conn.execute('INSERT INTO call_summary_cache SELECT * FROM call_summary')
+
+        # Keep SQLite's per-connection page cache warm across queries
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.commit()
+
     def init_ui(self):
         # Create central widget and layout
         central_widget = QWidget()
@@ -297,16 +569,15 @@ class MainWindow(QMainWindow):
         self.tab_widget.setTabsClosable(True)
         self.tab_widget.tabCloseRequested.connect(self.close_tab)
 
-        # Create main summary table
-        self.summary_table = QTableWidget()
-        self.summary_table.setColumnCount(4)
-        self.summary_table.setHorizontalHeaderLabels(
-            ["Phone Number", "Call History Total", "iTunes Total", "Difference"]
-        )
+        # Create main summary table backed by a typed model + filter proxy
+        self.summary_table = QTableView()
+        self.summary_model = SummaryModel()
+        self.summary_proxy = SummarySortProxy()
+        self.summary_proxy.setSourceModel(self.summary_model)
+        self.summary_table.setModel(self.summary_proxy)
 
-        # Store the current sort order
-        self.current_sort_column = 0
-        self.current_sort_order = Qt.AscendingOrder
+        # Clicking a highlighted difference opens the details tab
+        self.summary_table.clicked.connect(self.on_summary_clicked)
 
         self.populate_summary_table()
 
@@ -314,7 +585,7 @@ class MainWindow(QMainWindow):
         header = self.summary_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         header.setSortIndicatorShown(True)
-        header.sectionClicked.connect(self.sort_table)
+        self.summary_table.setSortingEnabled(True)
 
         # Add status bar
         self.status_bar = QStatusBar()
@@ -326,143 +597,33 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.summary_table)
         layout.addWidget(self.tab_widget)
 
-    def get_item_value(self, row, column):
-        """Helper function to get sortable value from table item"""
-        if column == 0:  # Phone Number column (with contact name)
-            item = self.summary_table.item(row, column)
-            if item:
-                text = item.text()
-                # Extract phone number from "Contact Name (phone)" format
-                if '(' in text and ')' in text:
-                    return text.split('(')[1].rstrip(')')
-                return text
-            return ""
-        elif column in [1, 2]:  # Call History Total and iTunes Total columns
-            item = self.summary_table.item(row, column)
-            return int(item.text()) if item else 0
-        else:  # Difference column
-            widget = self.summary_table.cellWidget(row, column)
-            if widget and isinstance(widget, QPushButton):
-                return int(widget.text())
-            item = self.summary_table.item(row, column)
-            return int(item.text()) if item else 0
-
-    def sort_table(self, column):
-        """Sort the table by the specified column"""
-        if self.current_sort_column == column:
-            # Toggle sort order if clicking the same column
-            self.current_sort_order = Qt.DescendingOrder if self.current_sort_order == Qt.AscendingOrder else Qt.AscendingOrder
-        else:
-            # Default to ascending order for new column
-            self.current_sort_order = Qt.AscendingOrder
-            self.current_sort_column = column
-
-        # Store the complete row data including widgets and formatting
-        rows_data = []
-        for row in range(self.summary_table.rowCount()):
-            row_items = []
-            for col in range(self.summary_table.columnCount()):
-                item = self.summary_table.item(row, col)
-                widget = self.summary_table.cellWidget(row, col)
-                background = item.background() if item else None
-                alignment = item.textAlignment() if item else None
-                
-                row_items.append({
-                    'item': item,
-                    'widget': widget,
-                    'background': background,
-                    'alignment': alignment,
-                    'sort_value': self.get_item_value(row, col)
-                })
-            rows_data.append((row_items, row))
-
-        # Sort based on the selected column
-        rows_data.sort(
-            key=lambda x: x[0][column]['sort_value'],
-            reverse=(self.current_sort_order == Qt.DescendingOrder)
-        )
-
-        # Rearrange the table contents
-        for new_index, (row_items, _) in enumerate(rows_data):
-            for col, cell_data in enumerate(row_items):
-                # Clear existing content
-                self.summary_table.takeItem(new_index, col)
-                if self.summary_table.cellWidget(new_index, col):
-                    self.summary_table.removeCellWidget(new_index, col)
-
-                # Restore widget if exists
-                if cell_data['widget']:
-                    self.summary_table.setCellWidget(new_index, col, cell_data['widget'])
-                # Restore item if exists
-                elif cell_data['item']:
-                    new_item = QTableWidgetItem(cell_data['item'])
-                    if cell_data['background']:
-                        new_item.setBackground(cell_data['background'])
-                    if cell_data['alignment']:
-                        new_item.setTextAlignment(cell_data['alignment'])
-                    self.summary_table.setItem(new_index, col, new_item)
-
-        # Update sort indicator
-        self.summary_table.horizontalHeader().setSortIndicator(column, self.current_sort_order)
-
     def populate_summary_table(self):
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get summary data from view
-            cursor.execute('SELECT * FROM call_summary ORDER BY phone_number')
-            rows = cursor.fetchall()
-            
-            self.summary_table.setRowCount(len(rows))
-            for i, row in enumerate(rows):
-                # Phone number with contact name
-                display_text = f"{row[0]}"
-                if row[1]:  # If contact name exists
-                    display_text = f"{row[1]} ({row[0]})"
-                number_item = QTableWidgetItem(display_text)
-                self.summary_table.setItem(i, 0, number_item)
-                
-                # Call history total
-                ch_total = QTableWidgetItem(str(row[2] or 0))
-                ch_total.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.summary_table.setItem(i, 1, ch_total)
-                
-                # iTunes total
-                it_total = QTableWidgetItem(str(row[3] or 0))
-                it_total.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.summary_table.setItem(i, 2, it_total)
-                
-                # Difference (clickable)
-                if row[4] > 0:
-                    diff_btn = QPushButton(str(row[4]))
-                    diff_btn.clicked.connect(lambda checked, num=row[0]: self.show_difference_details(num))
-                    self.summary_table.setCellWidget(i, 3, diff_btn)
-                    # Highlight rows with differences
-                    for col in range(4):
-                        item = self.summary_table.item(i, col)
-                        if item:
-                            item.setBackground(QColor(255, 255, 200))
-                else:
-                    diff_item = QTableWidgetItem('0')
-                    diff_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    self.summary_table.setItem(i, 3, diff_item)
-            
-            conn.close()
-            
+            cursor = self.conn.cursor()
+
+            # Read the materialized summary; counts stay typed for sorting
+            cursor.execute('SELECT * FROM call_summary_cache ORDER BY phone_number')
+            rows = [(row[0], row[1] or '', row[2] or 0, row[3] or 0, row[4] or 0)
+                    for row in cursor.fetchall()]
+
+            # Suspend view updates so the model reset triggers one repaint
+            self.summary_table.setUpdatesEnabled(False)
+            try:
+                self.summary_model.set_rows(rows)
+            finally:
+                self.summary_table.setUpdatesEnabled(True)
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error populating summary table: {str(e)}")
 
+    def on_summary_clicked(self, index):
+        # Only the Difference column is clickable, and only when non-zero
+        source_row = self.summary_proxy.mapToSource(index).row()
+        if index.column() == 3 and self.summary_model.diff_at(source_row) > 0:
+            self.show_difference_details(self.summary_model.phone_at(source_row))
+
     def filter_main_table(self):
-        search_text = self.search_box.text().lower()
-        for row in range(self.summary_table.rowCount()):
-            show_row = False
-            for col in range(self.summary_table.columnCount()):
-                item = self.summary_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    show_row = True
-                    break
-            self.summary_table.setRowHidden(row, not show_row)
+        self.summary_proxy.set_search(self.search_box.text())
         self.update_status_bar()
 
     def show_difference_details(self, phone_number):
@@ -474,7 +635,7 @@ class MainWindow(QMainWindow):
 
         # Create new tab
         try:
-            diff_tab = DifferenceDetailsTab(phone_number, self.db_path)
+            diff_tab = DifferenceDetailsTab(phone_number, self.conn)
             self.tab_widget.addTab(diff_tab, phone_number)
             self.tab_widget.setCurrentWidget(diff_tab)
         except Exception as e:
@@ -495,41 +656,39 @@ class MainWindow(QMainWindow):
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export Summary to CSV", "", "CSV Files (*.csv)")
             if filename:
-                with open(filename, 'w', newline='') as file:
+                # Stream the summary query, applying the search box as a
+                # LIKE predicate, instead of walking the table widgets
+                query = 'SELECT * FROM call_summary_cache'
+                params = []
+                search = self.search_box.text().strip()
+                if search:
+                    query += '''
+                        WHERE phone_number LIKE ? OR IFNULL(contact_name, '') LIKE ?
+                    '''
+                    params = [f'%{search}%'] * 2
+                query += ' ORDER BY phone_number'
+
+                with open(filename, 'w', newline='', buffering=1 << 20) as file:
                     writer = csv.writer(file)
-                    # Write headers
-                    headers = []
-                    for i in range(self.summary_table.columnCount()):
-                        headers.append(self.summary_table.horizontalHeaderItem(i).text())
-                    writer.writerow(headers)
-                    
-                    # Write visible rows
-                    for row in range(self.summary_table.rowCount()):
-                        if not self.summary_table.isRowHidden(row):
-                            row_data = []
-                            for col in range(self.summary_table.columnCount()):
-                                item = self.summary_table.item(row, col)
-                                if item:
-                                    row_data.append(item.text())
-                                else:
-                                    widget = self.summary_table.cellWidget(row, col)
-                                    if isinstance(widget, QPushButton):
-                                        row_data.append(widget.text())
-                                    else:
-                                        row_data.append("")
-                            writer.writerow(row_data)
-                            
+                    writer.writerow([
+                        "Phone Number", "Contact Name", "Call History Total",
+                        "iTunes Total", "Difference"
+                    ])
+
+                    cursor = self.conn.cursor()
+                    cursor.arraysize = 1000
+                    cursor.execute(query, params)
+                    writer.writerows(cursor)
+
                 QMessageBox.information(self, "Success", "Summary exported successfully!")
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error exporting summary: {str(e)}")
 
     def update_status_bar(self):
-        visible_rows = sum(1 for row in range(self.summary_table.rowCount()) 
-                         if not self.summary_table.isRowHidden(row))
-        total_rows = self.summary_table.rowCount()
-        total_differences = sum(1 for row in range(self.summary_table.rowCount())
-                              if self.summary_table.cellWidget(row, 3) is not None)
+        visible_rows = self.summary_proxy.rowCount()
+        total_rows = self.summary_model.rowCount()
+        total_differences = sum(1 for row in self.summary_model.rows() if row[4] > 0)
         self.status_bar.showMessage(
             f"Showing {visible_rows} of {total_rows} numbers | {total_differences} numbers with differences")
 
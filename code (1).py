@@ -1,19 +1,31 @@
 
-import biplist
-import io
-import re
+import plistlib
 import struct
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 import csv
 from collections import defaultdict
+from multiprocessing import Pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Hex record framing: everything outside these digits is stripped in one
+# C-level translate pass, and records are framed by the bplist00 marker.
+_HEX_DIGITS = b'0123456789abcdefABCDEF'
+_NON_HEX_BYTES = bytes(b for b in range(256) if b not in _HEX_DIGITS)
+_BPLIST_MARKER = b'62706C6973743030'
+_HEX_DEL_TABLE = str.maketrans('', '', _NON_HEX_BYTES.decode('latin-1'))
+
+@lru_cache(maxsize=4096)
 def parse_wns_time(wns_time_bytes):
-    """Parses WNS.time from bytes to a datetime object."""
+    """Parses WNS.time from bytes to a datetime object.
+
+    Cached on the raw 8 bytes: bursts of calls share timestamps, so
+    repeats skip the unpack and datetime arithmetic.
+    """
     seconds_since_reference = struct.unpack('>d', wns_time_bytes)[0]
     reference_date = datetime(2001, 1, 1)
     return reference_date + timedelta(seconds=seconds_since_reference)
@@ -27,17 +39,21 @@ def parse_field_length(data: bytes, start_idx: int) -> tuple[int, int]:
         return length, 3
     return 0, 0
 
-def decode_call_record(hex_data):
-    """Decodes a single call record from hex data."""
+def decode_call_record(hex_data, _clean=False):
+    """Decodes a single call record from hex data.
+
+    Pass _clean=True when the caller has already stripped non-hex characters.
+    """
     try:
-        # Remove any non-hex characters and convert to bytes.
-        hex_data = re.sub(r'[^0-9a-fA-F]', '', hex_data)
+        if not _clean:
+            # Remove any non-hex characters via the precomputed table
+            hex_data = hex_data.translate(_HEX_DEL_TABLE)
         binary_data = bytes.fromhex(hex_data)
-    
-        # Use biplist to decode the binary plist data
-        plist = biplist.read(io.BytesIO(binary_data))
+
+        # Decode the binary plist with the stdlib's C-backed parser
+        plist = plistlib.loads(binary_data, fmt=plistlib.FMT_BINARY)
         return plist
-    except biplist.InvalidPlistException as e:
+    except plistlib.InvalidFileException as e:
         logging.error(f"Invalid bplist format: {e}")
         return None
     except struct.error as e:
@@ -48,28 +64,33 @@ def decode_call_record(hex_data):
         return None
 
 
+def _decode_worker(record):
+    """Pool worker: decode one pre-cleaned hex record."""
+    return decode_call_record(record.decode('ascii'), _clean=True)
+
+
 def main():
     """
     Main function to read the raw.txt data, split into records, and decode each record.
     """
-    
-    with open("raw.txt", "r", encoding="utf-8") as f:
-      hex_data = f.read()
-    
-    # Split the hex data by the bplist00 marker, remove any empty strings
-    records = re.split(r'(?<=62706C6973743030)', hex_data)
-    records = [record for record in records if record]
-    
-    decoded_records = []
-    
-    for i, record in enumerate(records):
-        # Remove any non-hex characters and convert to bytes.
-        record = re.sub(r'[^0-9a-fA-F]', '', record)
-        decoded_record = decode_call_record(record)
-        if decoded_record:
-            decoded_records.append(decoded_record)
-        else:
-            logging.warning(f"Failed to decode record at index: {i}")
+
+    with open("raw.txt", "rb") as f:
+        raw = f.read()
+
+    # Strip non-hex bytes once, then split on the bplist00 marker and
+    # re-prepend it so every record is a complete plist
+    data = raw.translate(None, _NON_HEX_BYTES)
+    records = [_BPLIST_MARKER + chunk
+               for chunk in data.split(_BPLIST_MARKER)[1:] if chunk]
+
+    # Decoding is pure per-record work, so spread it across cores
+    with Pool() as pool:
+        results = list(pool.imap_unordered(_decode_worker, records, chunksize=64))
+
+    decoded_records = [r for r in results if r]
+    failed = len(results) - len(decoded_records)
+    if failed:
+        logging.warning(f"Failed to decode {failed} of {len(results)} records")
 
     # Print the decoded records
     for i, record in enumerate(decoded_records):
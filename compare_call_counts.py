@@ -1,15 +1,32 @@
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 def load_and_process_call_history(file_path):
+    if pl is not None:
+        # Stream the CSV through polars without materializing the full frame
+        counts = (pl.scan_csv(file_path)
+                    .group_by('Phone Number')
+                    .agg(pl.col('Call Timestamp').count().alias('count'))
+                    .collect(streaming=True))
+        return dict(zip(counts['Phone Number'], counts['count']))
     # Read call history CSV
-    df = pd.read_csv(file_path)
+    df = pd.read_csv(file_path, usecols=['Phone Number', 'Call Timestamp'])
     # Group by phone number and count occurrences
     call_counts = df.groupby('Phone Number')['Call Timestamp'].count().to_dict()
     return call_counts
 
 def load_and_process_itunes_calls(file_path):
+    if pl is not None:
+        counts = (pl.scan_csv(file_path)
+                    .select(['Phone Number', 'Total Calls'])
+                    .collect(streaming=True))
+        return dict(zip(counts['Phone Number'], counts['Total Calls']))
     # Read iTunes calls CSV
-    df = pd.read_csv(file_path)
+    df = pd.read_csv(file_path, usecols=['Phone Number', 'Total Calls'])
     # Get the Total Calls column directly
     call_counts = df.set_index('Phone Number')['Total Calls'].to_dict()
     return call_counts
@@ -18,23 +35,22 @@ def compare_call_counts():
     # Load data from both files
     call_history_counts = load_and_process_call_history('call_history.csv')
     itunes_counts = load_and_process_itunes_calls('itunes-calls.csv')
-    
-    # Get all unique phone numbers
-    all_numbers = set(list(call_history_counts.keys()) + list(itunes_counts.keys()))
-    
+
+    # Outer-join the two count Series and diff them in one vectorized pass
+    ch = pd.Series(call_history_counts, dtype='int64')
+    it = pd.Series(itunes_counts, dtype='int64')
+    report = pd.DataFrame({'history': ch, 'itunes': it}).fillna(0).astype('int64')
+    report['difference'] = (report['history'] - report['itunes']).abs()
+    mismatches = report[report['difference'] != 0].sort_index()
+
     # Compare counts
     print("\nCall Count Comparison:")
     print("-" * 80)
     print(f"{'Phone Number':<20} {'Call History':<15} {'iTunes':<15} {'Difference':<15}")
     print("-" * 80)
-    
-    for number in sorted(all_numbers):
-        history_count = call_history_counts.get(number, 0)
-        itunes_count = itunes_counts.get(number, 0)
-        difference = abs(history_count - itunes_count)
-        
-        if history_count != itunes_count:
-            print(f"{number:<20} {history_count:<15} {itunes_count:<15} {difference:<15}")
+
+    for number, history_count, itunes_count, difference in mismatches.itertuples():
+        print(f"{number:<20} {history_count:<15} {itunes_count:<15} {difference:<15}")
 
 if __name__ == "__main__":
-    compare_call_counts() 
\ No newline at end of file
+    compare_call_counts()
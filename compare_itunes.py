@@ -1,37 +1,49 @@
-import csv
+from collections import Counter
+import numpy as np
+import pandas as pd
 from openpyxl import load_workbook
 from datetime import datetime
 
+try:
+    # Rust-based XLSX parser; much faster than openpyxl when installed
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
 def load_csv_log(filename):
-    calls = {}
-    with open(filename, 'r') as file:
-        reader = csv.reader(file)
-        next(reader)  # Skip header
-        for row in reader:
-            if not row:  # Skip empty rows
-                continue
-            call_id = row[0]
-            calls[call_id] = {
-                'id': call_id,
-                'phone': row[1],
-                'count': row[2],
-                'timestamp': row[4],
-                'type': row[6],
-                'battery': row[8],
-                'area_code': row[10]
-            }
-    return calls
+    # Parse with pandas' C engine, reading only the columns we keep
+    df = pd.read_csv(filename, header=0, usecols=[0, 1, 2, 4, 6, 8, 10],
+                     dtype=str).fillna('')
+    df.columns = ['id', 'phone', 'count', 'timestamp', 'type', 'battery',
+                  'area_code']
+    return {rec['id']: rec for rec in df.to_dict('records')}
 
 def load_excel_log(filename):
+    if HAS_CALAMINE:
+        # Parse the sheet in Rust and build the dict from whole columns
+        df = pd.read_excel(filename, engine='calamine', dtype=str)
+        df = df.reindex(columns=['Phone Number', 'Timestamp', 'Call Type',
+                                 'Area Code']).fillna('')
+        recs = pd.DataFrame({
+            'phone': df['Phone Number'].astype(str),
+            'timestamp': df['Timestamp'].astype(str),
+            'type': df['Call Type'].astype(str),
+            'area_code': df['Area Code'].astype(str),
+        })
+        recs['id'] = recs['phone'] + '_' + recs['timestamp']
+        return dict(zip(recs['id'], recs.to_dict('records')))
+
     calls = {}
-    wb = load_workbook(filename)
+    # Stream rows as plain tuples; read_only skips building Cell objects
+    wb = load_workbook(filename, read_only=True, data_only=True)
     ws = wb.active
-    headers = [cell.value for cell in ws[1]]
-    
-    for row in ws.iter_rows(min_row=2):
-        values = [cell.value for cell in row]
+    rows = ws.iter_rows(values_only=True)
+    headers = next(rows)
+
+    for values in rows:
         row_data = dict(zip(headers, values))
-        
+
         # Create a unique ID for Excel records
         call_id = f"{row_data.get('Phone Number', '')}_{row_data.get('Timestamp', '')}"
         calls[call_id] = {
@@ -41,6 +53,7 @@ def load_excel_log(filename):
             'type': str(row_data.get('Call Type', '')),
             'area_code': str(row_data.get('Area Code', ''))
         }
+    wb.close()  # read-only mode keeps the file handle open
     return calls
 
 # Load both logs
@@ -49,14 +62,21 @@ csv_log = load_csv_log('call_history.csv')
 print("Loading iTunes log...")
 excel_log = load_excel_log('Itunes-call-history.xlsx')
 
-# Create sets of phone numbers and timestamps for comparison
-csv_calls = {(call['phone'], call['timestamp']) for call in csv_log.values()}
-excel_calls = {(call['phone'], call['timestamp']) for call in excel_log.values()}
+# Build phone|timestamp key arrays and compare with numpy set ops
+def call_keys(log):
+    if not log:
+        return np.array([], dtype=str)
+    phones = np.array([call['phone'] for call in log.values()], dtype=str)
+    times = np.array([call['timestamp'] for call in log.values()], dtype=str)
+    return np.unique(np.char.add(np.char.add(phones, '|'), times))
+
+csv_keys = call_keys(csv_log)
+excel_keys = call_keys(excel_log)
 
 # Find unique calls in each log
-csv_only = csv_calls - excel_calls
-excel_only = excel_calls - csv_calls
-common = csv_calls & excel_calls
+csv_only = np.setdiff1d(csv_keys, excel_keys, assume_unique=True)
+excel_only = np.setdiff1d(excel_keys, csv_keys, assume_unique=True)
+common = np.intersect1d(csv_keys, excel_keys, assume_unique=True)
 
 # Print results
 print("\nCall Log Comparison Analysis")
@@ -66,33 +86,23 @@ print(f"Total calls in iTunes: {len(excel_log)}")
 print(f"Common calls: {len(common)}")
 
 print("\nCalls only in CSV file (first 10):")
-for phone, timestamp in sorted(list(csv_only)[:10], key=lambda x: x[1]):
+for key in csv_only[:10]:
+    phone, timestamp = key.split('|', 1)
     print(f"- {timestamp}: {phone}")
 
 print("\nCalls only in iTunes file (first 10):")
-for phone, timestamp in sorted(list(excel_only)[:10], key=lambda x: x[1]):
+for key in excel_only[:10]:
+    phone, timestamp = key.split('|', 1)
     print(f"- {timestamp}: {phone}")
 
-# Analyze call patterns
-csv_numbers = {}
-excel_numbers = {}
-
-for call in csv_log.values():
-    phone = call['phone']
-    if phone not in csv_numbers:
-        csv_numbers[phone] = 0
-    csv_numbers[phone] += 1
-
-for call in excel_log.values():
-    phone = call['phone']
-    if phone not in excel_numbers:
-        excel_numbers[phone] = 0
-    excel_numbers[phone] += 1
+# Analyze call patterns in a single counting pass each
+csv_numbers = Counter(call['phone'] for call in csv_log.values())
+excel_numbers = Counter(call['phone'] for call in excel_log.values())
 
 print("\nTop 5 most called numbers in CSV:")
-for phone, count in sorted(csv_numbers.items(), key=lambda x: x[1], reverse=True)[:5]:
+for phone, count in csv_numbers.most_common(5):
     print(f"- {phone}: {count} calls")
 
 print("\nTop 5 most called numbers in iTunes:")
-for phone, count in sorted(excel_numbers.items(), key=lambda x: x[1], reverse=True)[:5]:
-    print(f"- {phone}: {count} calls") 
+for phone, count in excel_numbers.most_common(5):
+    print(f"- {phone}: {count} calls")
@@ -4,40 +4,59 @@ from typing import Dict, List, Any
 import struct
 import binascii
 
+# Timestamp decoding constants, built once at import
+_WNS_DOUBLE = struct.Struct('>d')
+_WNS_EPOCH = datetime.datetime(2001, 1, 1)
+
+# Per-record patterns, compiled once at import
+_PHONE_RE = re.compile(rb'\\\\?\+\d{10,}')
+_NAME_RE = re.compile(rb'_([A-Z\s]+[A-Z])(?=|$)')
+_UUID_RE = re.compile(rb'\$([A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12})')
+_DURATION_RE = re.compile(rb'duration.*?([0-9]{1,4})')
+_JUNK_RE = re.compile(rb'junkConfidence.*?([0-9]{1,3})')
+
 def parse_wns_time(data: bytes, start_idx: int) -> datetime.datetime:
     """Parse WNS.time format timestamp from binary data."""
     try:
         # Skip the WNS.time# prefix
         start_idx = start_idx + 9
         
-        # Read 8 bytes after the prefix
-        timestamp_bytes = data[start_idx:start_idx + 8]
-        if len(timestamp_bytes) == 8:
-            timestamp = struct.unpack('>d', timestamp_bytes)[0]
-            base_date = datetime.datetime(2001, 1, 1)
-            return base_date + datetime.timedelta(seconds=timestamp)
+        # Read 8 bytes after the prefix, straight from the buffer
+        if start_idx + 8 <= len(data):
+            (timestamp,) = _WNS_DOUBLE.unpack_from(data, start_idx)
+            return _WNS_EPOCH + datetime.timedelta(seconds=timestamp)
     except Exception as e:
         print(f"Error parsing timestamp: {e}")
     return None
 
+def find_marker_offsets(data: bytes, marker: bytes) -> List[int]:
+    """Locate successive marker offsets with one linear bytes.find scan."""
+    offsets = []
+    i = data.find(marker)
+    while i != -1:
+        offsets.append(i)
+        i = data.find(marker, i + len(marker))
+    return offsets
+
 def extract_call_records(content: bytes) -> List[Dict[str, Any]]:
     """Extract call records using pattern matching."""
     records = []
-    
-    # Find all CHTransaction blocks
-    transactions = re.finditer(b'CHTransaction.*?(?=CHTransaction|$)', content, re.DOTALL)
-    
-    for transaction in transactions:
+
+    # Find all CHTransaction blocks by marker offset instead of a
+    # backtracking non-greedy regex over the whole buffer
+    offsets = find_marker_offsets(content, b'CHTransaction')
+
+    for start, end in zip(offsets, offsets[1:] + [len(content)]):
         record = {}
-        transaction_data = transaction.group(0)
-        
+        transaction_data = content[start:end]
+
         # Extract phone number (improved pattern)
-        phone_match = re.search(rb'\\\\?\+\d{10,}', transaction_data)
+        phone_match = _PHONE_RE.search(transaction_data)
         if phone_match:
             record['callerId'] = phone_match.group(0).decode('utf-8').replace('\\', '')
             
         # Extract contact name
-        name_match = re.search(rb'_([A-Z\s]+[A-Z])(?=|$)', transaction_data)
+        name_match = _NAME_RE.search(transaction_data)
         if name_match:
             try:
                 name = name_match.group(1).decode('utf-8')
@@ -47,7 +66,7 @@ def extract_call_records(content: bytes) -> List[Dict[str, Any]]:
                 pass
                 
         # Extract UUID
-        uuid_match = re.search(rb'\$([A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12})', transaction_data)
+        uuid_match = _UUID_RE.search(transaction_data)
         if uuid_match:
             record['uniqueId'] = uuid_match.group(1).decode('utf-8')
             
@@ -74,7 +93,7 @@ def extract_call_records(content: bytes) -> List[Dict[str, Any]]:
                 record['date'] = parsed_time.strftime('%Y-%m-%d %H:%M:%S')
                 
         # Extract duration (new pattern)
-        duration_match = re.search(rb'duration.*?([0-9]{1,4})', transaction_data)
+        duration_match = _DURATION_RE.search(transaction_data)
         if duration_match:
             try:
                 duration = int(duration_match.group(1))
@@ -84,7 +103,7 @@ def extract_call_records(content: bytes) -> List[Dict[str, Any]]:
                 pass
                 
         # Extract junk confidence (new pattern)
-        junk_match = re.search(rb'junkConfidence.*?([0-9]{1,3})', transaction_data)
+        junk_match = _JUNK_RE.search(transaction_data)
         if junk_match:
             try:
                 confidence = int(junk_match.group(1))
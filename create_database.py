@@ -1,29 +1,28 @@
-import pandas as pd
+import csv
 import sqlite3
-from datetime import datetime
 
-def standardize_phone_number(phone):
-    """Standardize phone number format to include '+1' prefix if missing"""
-    try:
-        phone = str(phone).strip()
-        if not phone.startswith('+1'):
-            if phone.startswith('1'):
-                return '+' + phone
-            return '+1' + phone
-        return phone
-    except Exception as e:
-        print(f"Error standardizing phone number: {e}")
-        return phone
+# Phone normalization as SQL, matching standardize_phone_number
+PHONE_NORM = ("CASE WHEN TRIM({c}) LIKE '+1%' THEN TRIM({c}) "
+              "WHEN TRIM({c}) LIKE '1%' THEN '+' || TRIM({c}) "
+              "ELSE '+1' || TRIM({c}) END")
 
 def create_database():
     # Create/connect to SQLite database
     conn = sqlite3.connect('call_history.db')
     cursor = conn.cursor()
-    
-    # Drop existing views and tables
+
+    # Bulk-load settings: WAL + relaxed sync avoid a fsync per insert
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=OFF')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+
+    # Drop existing views and tables. The viewer's materialized summary
+    # goes too: dropping call_history kills the triggers that maintain
+    # it, and the viewer re-seeds an empty cache on next connect
     cursor.execute('DROP VIEW IF EXISTS call_summary')
     cursor.execute('DROP TABLE IF EXISTS call_history')
-    
+    cursor.execute('DROP TABLE IF EXISTS call_summary_cache')
+
     # Create tables
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS call_history (
@@ -36,83 +35,84 @@ def create_database():
         contact_name TEXT
     )
     ''')
-    
+
     # Create indices for better performance
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_phone_number ON call_history(phone_number)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON call_history(timestamp)')
-    
+
     try:
-        # Read JPREGCALL CSV for contact names
-        jpreg_df = pd.read_csv('JPREGCALL.csv')
-        jpreg_df['Number'] = jpreg_df['Number'].apply(standardize_phone_number)
-        # Create a dictionary of phone numbers to contact names, keeping only the most recent contact name for each number
-        contact_dict = {}
-        for _, row in jpreg_df.iterrows():
-            phone = row['Number']
-            contact = row['Contact']
-            if contact and not contact.startswith('+') and not contact.isdigit():
-                contact_dict[phone] = contact
-        
-        # Read Call History CSV
-        ch_df = pd.read_csv('call_history.csv')
-        ch_df['Phone Number'] = ch_df['Phone Number'].apply(standardize_phone_number)
-        ch_df['Call Timestamp'] = pd.to_datetime(ch_df['Call Timestamp'])
-        
-        # Insert Call History data
-        ch_records = []
-        for _, row in ch_df.iterrows():
-            phone = row['Phone Number']
-            ch_records.append((
-                phone,
-                row['Call Timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
-                row.get('Call Type', 'Unknown'),
-                row.get('Service', 'Unknown'),
-                'call_history',
-                contact_dict.get(phone, '')
-            ))
-        
-        # Read iTunes Calls CSV
-        it_df = pd.read_csv('itunes-calls.csv')
-        it_df['Phone Number'] = it_df['Phone Number'].apply(standardize_phone_number)
-        it_df['Timestamp'] = pd.to_datetime(it_df['Timestamp'])
-        
-        # Insert iTunes data
-        it_records = []
-        for _, row in it_df.iterrows():
-            phone = row['Phone Number']
-            it_records.append((
-                phone,
-                row['Timestamp'].strftime('%Y-%m-%d %H:%M:%S'),
-                row.get('Call Type', 'Unknown'),
-                row.get('Service', 'Unknown'),
-                'itunes',
-                contact_dict.get(phone, '')
-            ))
-        
-        # Batch insert records
-        cursor.executemany(
-            'INSERT INTO call_history (phone_number, timestamp, call_type, service, source, contact_name) VALUES (?, ?, ?, ?, ?, ?)',
-            ch_records + it_records
-        )
-        
+        cursor.execute('BEGIN')
+
+        # Shovel the CSVs into temp tables; all transformation happens in SQL
+        cursor.execute('CREATE TEMP TABLE raw_contacts (number TEXT, contact TEXT)')
+        with open('JPREGCALL.csv', newline='') as f:
+            reader = csv.DictReader(f)
+            cursor.executemany(
+                'INSERT INTO raw_contacts VALUES (?, ?)',
+                ((row['Number'], row['Contact']) for row in reader))
+
+        cursor.execute('CREATE TEMP TABLE raw_ch (phone TEXT, ts TEXT, ctype TEXT, service TEXT)')
+        with open('call_history.csv', newline='') as f:
+            reader = csv.DictReader(f)
+            cursor.executemany(
+                'INSERT INTO raw_ch VALUES (?, ?, ?, ?)',
+                ((row['Phone Number'], row['Call Timestamp'],
+                  row.get('Call Type', 'Unknown'), row.get('Service', 'Unknown'))
+                 for row in reader))
+
+        cursor.execute('CREATE TEMP TABLE raw_it (phone TEXT, ts TEXT, ctype TEXT, service TEXT)')
+        with open('itunes-calls.csv', newline='') as f:
+            reader = csv.DictReader(f)
+            cursor.executemany(
+                'INSERT INTO raw_it VALUES (?, ?, ?, ?)',
+                ((row['Phone Number'], row['Timestamp'],
+                  row.get('Call Type', 'Unknown'), row.get('Service', 'Unknown'))
+                 for row in reader))
+
+        # Contact names: drop pure-digit and '+'-prefixed "names", keep the
+        # most recent entry per normalized number (bare contact follows
+        # MAX(rowid) under SQLite's bare-column rule)
+        norm_number = PHONE_NORM.format(c='number')
+        cursor.execute(f'''
+        CREATE TEMP TABLE contacts AS
+        SELECT {norm_number} AS number, contact, MAX(rowid)
+        FROM raw_contacts
+        WHERE contact IS NOT NULL AND contact <> ''
+            AND contact NOT LIKE '+%' AND contact GLOB '*[^0-9]*'
+        GROUP BY {norm_number}
+        ''')
+        cursor.execute('CREATE INDEX temp.ix_contacts_number ON contacts(number)')
+
+        # One INSERT..SELECT per source replaces the Python ingest loops
+        norm_phone = PHONE_NORM.format(c='phone')
+        for source, raw_table in (('call_history', 'raw_ch'), ('itunes', 'raw_it')):
+            cursor.execute(f'''
+            INSERT INTO call_history (phone_number, timestamp, call_type,
+                                      service, source, contact_name)
+            SELECT {norm_phone}, ts, ctype, service, ?,
+                   COALESCE((SELECT contact FROM contacts
+                             WHERE number = {norm_phone}), '')
+            FROM {raw_table}
+            ''', (source,))
+
         # Create views for convenience
         cursor.execute('''
         CREATE VIEW IF NOT EXISTS call_summary AS
-        SELECT 
+        SELECT
             phone_number,
             MAX(contact_name) as contact_name,
             COUNT(CASE WHEN source = 'call_history' THEN 1 END) as call_history_count,
             COUNT(CASE WHEN source = 'itunes' THEN 1 END) as itunes_count,
-            ABS(COUNT(CASE WHEN source = 'call_history' THEN 1 END) - 
+            ABS(COUNT(CASE WHEN source = 'call_history' THEN 1 END) -
                 COUNT(CASE WHEN source = 'itunes' THEN 1 END)) as difference
         FROM call_history
         GROUP BY phone_number
         ''')
-        
+
         # Commit changes
         conn.commit()
         print("Database created successfully!")
-        
+
     except Exception as e:
         print(f"Error creating database: {e}")
         conn.rollback()
@@ -120,4 +120,4 @@ def create_database():
         conn.close()
 
 if __name__ == '__main__':
-    create_database() 
\ No newline at end of file
+    create_database()
@@ -1,11 +1,43 @@
 import plistlib
 import binascii
+import numpy as np
+import pandas as pd
 from collections import defaultdict
 import struct
 from datetime import datetime, timedelta
+from functools import lru_cache
 import re
 from typing import Dict, List, Any
-import csv
+import bisect
+import mmap
+import operator
+from concurrent.futures import ProcessPoolExecutor
+
+# Timestamp decoding constants, built once at import
+_WNS_DOUBLE = struct.Struct('>d')
+_WNS_EPOCH = datetime(2001, 1, 1)
+
+# Per-record patterns, compiled once at import
+_UUID_RE = re.compile(rb'\$([A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12})')
+_NAME_RE = re.compile(rb'_([A-Z][A-Za-z\s]{2,}[A-Z])(?=\s|$)')
+_JUNK_RE = re.compile(rb'junkConfidence\D*(\d{1,3})(?!\d)')
+_DIR_RE = re.compile(rb'outgoing|incoming|missed|rejected|blocked')
+_DIR_MARKERS = {
+    b'outgoing': b'\x10\x01',
+    b'incoming': b'\x10\x02',
+    b'missed': b'\x10\x03',
+    b'rejected': b'\x10\x04',
+    b'blocked': b'\x10\x05',
+}
+_FIELD_RE = re.compile(rb'callType|service|callerIdLocation')
+_PHONE_PATTERNS = [re.compile(p) for p in (
+    rb'(?:\\\\|\+)\+?(\d{10,})',  # Pattern for +1 format with escape chars
+    rb'\+(\d{10,})',  # Pattern for +1 format without escape
+    rb'(?<=[^0-9])(\d{10})(?=[^0-9])',  # Raw 10-digit numbers
+    rb'(?<=[^0-9])(\d{3}[-\.\s]\d{3}[-\.\s]\d{4})(?=[^0-9])',  # Format: XXX-XXX-XXXX or XXX.XXX.XXXX
+    rb'(?<=[^0-9])\((\d{3})\)\s*\d{3}[-\.\s]\d{4}(?=[^0-9])',  # Format: (XXX) XXX-XXXX
+    rb'(?<=[^0-9])(\d{3})\s+\d{3}\s+\d{4}(?=[^0-9])'  # Format: XXX XXX XXXX
+)]
 
 def parse_wns_time(data: bytes, start_idx: int) -> datetime:
     """Parse WNS.time format timestamp from binary data."""
@@ -13,17 +45,14 @@ def parse_wns_time(data: bytes, start_idx: int) -> datetime:
         # Skip the WNS.time# prefix
         start_idx = start_idx + 9
         
-        # Read 8 bytes after the prefix
-        timestamp_bytes = data[start_idx:start_idx + 8]
-        if len(timestamp_bytes) == 8:
-            # WNS uses double-precision floating point for seconds since epoch
-            timestamp = struct.unpack('>d', timestamp_bytes)[0]
-            
-            # WNS uses 2001-01-01 as epoch base (like Apple)
-            base_date = datetime(2001, 1, 1)
-            
+        # Read 8 bytes after the prefix, straight from the buffer
+        if start_idx + 8 <= len(data):
+            # WNS uses double-precision floating point for seconds since
+            # the 2001-01-01 Apple epoch
+            (timestamp,) = _WNS_DOUBLE.unpack_from(data, start_idx)
+
             # Convert to UTC datetime
-            dt = base_date + timedelta(seconds=timestamp)
+            dt = _WNS_EPOCH + timedelta(seconds=timestamp)
             
             # Debug timestamp conversion
             print(f"Raw timestamp value: {timestamp}")
@@ -46,26 +75,14 @@ def parse_field_length(data: bytes, start_idx: int) -> tuple[int, int]:
 def parse_call_properties(data: bytes) -> Dict[str, Any]:
     properties = {}
     
-    # Enhanced call direction parsing
-    # Look for specific byte patterns that indicate call direction
-    direction_patterns = [
-        (b'outgoing', b'\x10\x01', 'outgoing'),  # Pattern for outgoing calls
-        (b'incoming', b'\x10\x02', 'incoming'),   # Pattern for incoming calls
-        (b'missed', b'\x10\x03', 'missed'),       # Pattern for missed calls
-        (b'rejected', b'\x10\x04', 'rejected'),   # Pattern for rejected calls
-        (b'blocked', b'\x10\x05', 'blocked')      # Pattern for blocked calls
-    ]
-    
-    for pattern_name, pattern_bytes, direction_type in direction_patterns:
-        # Search for the pattern name first
-        pattern_pos = data.find(pattern_name)
-        if pattern_pos != -1:
-            # Look for the corresponding byte pattern within a reasonable range
-            direction_pos = data.find(pattern_bytes, pattern_pos, pattern_pos + 20)
-            if direction_pos != -1:
-                properties['direction'] = direction_type
-                print(f"Found {direction_type} call at position {direction_pos}")
-                break
+    # Enhanced call direction parsing: one alternation scan finds the
+    # direction keywords, confirmed by the marker bytes nearby
+    for match in _DIR_RE.finditer(data):
+        keyword = match.group(0)
+        if _DIR_MARKERS[keyword] in data[match.start():match.start() + 20]:
+            properties['direction'] = keyword.decode('ascii')
+            print(f"Found {properties['direction']} call at position {match.start()}")
+            break
     
     # Enhanced duration parsing with field length handling
     duration_pos = data.find(b'duration')
@@ -83,26 +100,34 @@ def parse_call_properties(data: bytes) -> Dict[str, Any]:
                 except (ValueError, UnicodeDecodeError) as e:
                     print(f"Error parsing duration: {e}")
     
-    # Parse other properties with explicit length handling
-    for field_name in [b'callType', b'service', b'callerIdLocation']:
-        field_pos = data.find(field_name)
-        if field_pos != -1:
-            pos = field_pos + len(field_name)
-            if pos < len(data):
-                length, bytes_consumed = parse_field_length(data, pos)
-                if length > 0:
-                    try:
-                        field_bytes = data[pos + bytes_consumed:pos + bytes_consumed + length]
-                        field_value = field_bytes.decode('utf-8')
-                        properties[field_name.decode('ascii')] = field_value
-                        print(f"Parsed {field_name}: {field_value}")
-                    except (ValueError, UnicodeDecodeError) as e:
-                        print(f"Error parsing {field_name}: {e}")
+    # Parse other properties with explicit length handling; a single
+    # alternation scan covers all three field names, first hit wins
+    for match in _FIELD_RE.finditer(data):
+        field_name = match.group(0)
+        key = field_name.decode('ascii')
+        if key in properties:
+            continue
+        pos = match.end()
+        if pos < len(data):
+            length, bytes_consumed = parse_field_length(data, pos)
+            if length > 0:
+                try:
+                    field_bytes = data[pos + bytes_consumed:pos + bytes_consumed + length]
+                    field_value = field_bytes.decode('utf-8')
+                    properties[key] = field_value
+                    print(f"Parsed {field_name}: {field_value}")
+                except (ValueError, UnicodeDecodeError) as e:
+                    print(f"Error parsing {field_name}: {e}")
     
     return properties
 
+@lru_cache(maxsize=100_000)
 def standardize_phone_number(number: str) -> str:
-    """Standardize phone number to +XXXXXXXXXX format"""
+    """Standardize phone number to +XXXXXXXXXX format.
+
+    Cached: the same numbers repeat across a call history, so repeats
+    skip the digit filtering.
+    """
     if not number or number == 'Unknown':
         return 'Unknown'
     
@@ -114,127 +139,129 @@ def standardize_phone_number(number: str) -> str:
         return f"+{digits}"
     return digits
 
-def extract_call_metadata(data: bytes) -> Dict[str, Any]:
+def parse_one_transaction(task) -> Dict[str, Any]:
+    """Parse a single (call_id, transaction bytes) pair into a call dict.
+
+    Pure function with no shared state, so it can run in a worker
+    process.
+    """
+    call_id, transaction_data = task
+    try:
+        call = {
+            'id': call_id,
+            'number': None,
+            'name': None,
+            'timestamp': None,
+            'duration': None,
+            'type': None,
+            'direction': None,
+            'junk_confidence': None,
+            'service': None
+        }
+
+        # Extract phone number with multiple patterns while preserving original format
+        for pattern in _PHONE_PATTERNS:
+            phone_match = pattern.search(transaction_data)
+            if phone_match:
+                try:
+                    # Get the matched number and standardize it
+                    number = phone_match.group(0).decode('utf-8')
+                    number = number.replace('\\', '')
+                    call['number'] = standardize_phone_number(number)
+                    break
+                except:
+                    continue
+
+        # Extract contact name (filter out VNSUUID)
+        name_match = _NAME_RE.search(transaction_data)
+        if name_match:
+            try:
+                name = name_match.group(1).decode('utf-8')
+                if name != "VNSUUID" and len(name) > 3 and not name.startswith('WNS'):
+                    call['name'] = name
+            except:
+                pass
+
+        # Extract service type and call type
+        if b'com.apple.Telephony' in transaction_data:
+            call['type'] = 'cellular'
+            call['service'] = 'com.apple.Telephony'
+        elif b'com.apple.FaceTime' in transaction_data:
+            call['type'] = 'facetime'
+            call['service'] = 'com.apple.FaceTime'
+
+        # Parse call properties with enhanced parsing
+        properties = parse_call_properties(transaction_data)
+        call.update(properties)
+
+        # Extract timestamp
+        time_idx = transaction_data.find(b'WNS.time#')
+        if time_idx != -1:
+            call['timestamp'] = parse_wns_time(transaction_data, time_idx)
+
+        # Extract junk confidence (improved pattern)
+        junk_match = _JUNK_RE.search(transaction_data)
+        if junk_match:
+            try:
+                confidence = int(junk_match.group(1))
+                if 0 <= confidence <= 100:  # Valid percentage range
+                    call['junk_confidence'] = confidence
+            except:
+                pass
+
+        return call
+
+    except Exception as e:
+        print(f"Error parsing call record: {e}")
+        return None
+
+def extract_call_metadata(data: bytes, positions: List[int] = None) -> Dict[str, Any]:
     metadata = {
         'calls': [],
         'stats': defaultdict(int)
     }
-    
-    # Track seen call IDs to prevent duplicates
+
+    # Transaction boundaries, reusing the caller's scan when one was done
+    offsets = positions if positions is not None else find_bplist_positions(data)
+    bounds = offsets + [len(data)]
+    print(f"\nFound {len(offsets)} potential transactions")
+
+    # Debug first transaction if any exist
+    if offsets:
+        first_trans = data[offsets[0]:bounds[1]]
+        print(f"First transaction size: {len(first_trans)} bytes")
+        print(f"First transaction hex preview: {binascii.hexlify(first_trans[:50]).decode('ascii')}")
+
+    # One UUID sweep over the whole buffer, deduplicated up front
     seen_calls = set()
-    
-    def find_transactions(data: bytes) -> List[bytes]:
-        # More precise boundary detection
-        transactions = list(re.finditer(b'bplist00.*?(?=bplist00|$)', data, re.DOTALL))
-        print(f"\nFound {len(transactions)} potential transactions")
-        
-        # Debug first transaction if any exist
-        if transactions:
-            first_trans = transactions[0].group(0)
-            print(f"First transaction size: {len(first_trans)} bytes")
-            print(f"First transaction hex preview: {binascii.hexlify(first_trans[:50]).decode('ascii')}")
-        
-        return transactions
-    
-    # Get the transactions by calling the function
-    transactions = find_transactions(data)
-    
-    for transaction in transactions:
-        try:
-            transaction_data = transaction.group(0)
-            
-            # Extract UUID first to check for duplicates
-            uuid_match = re.search(rb'\$([A-F0-9]{8}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{4}-[A-F0-9]{12})', transaction_data)
-            if not uuid_match:
-                continue
-                
-            call_id = uuid_match.group(1).decode('utf-8')
-            if call_id in seen_calls:
-                continue
-            seen_calls.add(call_id)
-            
-            call = {
-                'id': call_id,
-                'number': None,
-                'name': None,
-                'timestamp': None,
-                'duration': None,
-                'type': None,
-                'direction': None,
-                'junk_confidence': None,
-                'service': None
-            }
-            
-            # Extract phone number with multiple patterns while preserving original format
-            phone_patterns = [
-                rb'(?:\\\\|\+)\+?(\d{10,})',  # Pattern for +1 format with escape chars
-                rb'\+(\d{10,})',  # Pattern for +1 format without escape
-                rb'(?<=[^0-9])(\d{10})(?=[^0-9])',  # Raw 10-digit numbers
-                rb'(?<=[^0-9])(\d{3}[-\.\s]\d{3}[-\.\s]\d{4})(?=[^0-9])',  # Format: XXX-XXX-XXXX or XXX.XXX.XXXX
-                rb'(?<=[^0-9])\((\d{3})\)\s*\d{3}[-\.\s]\d{4}(?=[^0-9])',  # Format: (XXX) XXX-XXXX
-                rb'(?<=[^0-9])(\d{3})\s+\d{3}\s+\d{4}(?=[^0-9])'  # Format: XXX XXX XXXX
-            ]
-            
-            for pattern in phone_patterns:
-                phone_match = re.search(pattern, transaction_data)
-                if phone_match:
-                    try:
-                        # Get the matched number and standardize it
-                        number = phone_match.group(0).decode('utf-8')
-                        number = number.replace('\\', '')
-                        call['number'] = standardize_phone_number(number)
-                        break
-                    except:
-                        continue
-            
-            # Extract contact name (filter out VNSUUID)
-            name_match = re.search(rb'_([A-Z][A-Za-z\s]{2,}[A-Z])(?=\s|$)', transaction_data)
-            if name_match:
-                try:
-                    name = name_match.group(1).decode('utf-8')
-                    if name != "VNSUUID" and len(name) > 3 and not name.startswith('WNS'):
-                        call['name'] = name
-                except:
-                    pass
-            
-            # Extract service type and call type
-            if b'com.apple.Telephony' in transaction_data:
-                call['type'] = 'cellular'
-                call['service'] = 'com.apple.Telephony'
-                metadata['stats']['cellular'] += 1
-            elif b'com.apple.FaceTime' in transaction_data:
-                call['type'] = 'facetime'
-                call['service'] = 'com.apple.FaceTime'
-                metadata['stats']['facetime'] += 1
-            
-            # Parse call properties with enhanced parsing
-            properties = parse_call_properties(transaction_data)
-            call.update(properties)
-            
-            # Update stats based on direction
-            if call['direction'] in metadata['stats']:
-                metadata['stats'][call['direction']] += 1
-            
-            # Extract timestamp
-            time_idx = transaction_data.find(b'WNS.time#')
-            if time_idx != -1:
-                call['timestamp'] = parse_wns_time(transaction_data, time_idx)
-            
-            # Extract junk confidence (improved pattern)
-            junk_match = re.search(rb'junkConfidence\D*(\d{1,3})(?!\d)', transaction_data)
-            if junk_match:
-                try:
-                    confidence = int(junk_match.group(1))
-                    if 0 <= confidence <= 100:  # Valid percentage range
-                        call['junk_confidence'] = confidence
-                except:
-                    pass
-            
-            metadata['calls'].append(call)
-            
-        except Exception as e:
-            print(f"Error parsing call record: {e}")
-    
+    tasks = []
+    for uuid_match in _UUID_RE.finditer(data):
+        call_id = uuid_match.group(1).decode('utf-8')
+        if call_id in seen_calls:
+            continue
+        seen_calls.add(call_id)
+        # Locate the enclosing transaction block
+        i = bisect.bisect_right(offsets, uuid_match.start()) - 1
+        if i < 0:
+            continue
+        tasks.append((call_id, bytes(data[offsets[i]:bounds[i + 1]])))
+
+    # Transactions are independent; parse them across all cores
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(parse_one_transaction, tasks, chunksize=256)
+
+    # Aggregate calls and stats in the parent
+    for call in results:
+        if call is None:
+            continue
+        if call['type'] == 'cellular':
+            metadata['stats']['cellular'] += 1
+        elif call['type'] == 'facetime':
+            metadata['stats']['facetime'] += 1
+        if call['direction'] in metadata['stats']:
+            metadata['stats'][call['direction']] += 1
+        metadata['calls'].append(call)
+
     return metadata
 
 def adjust_timestamp(ts: datetime) -> datetime:
@@ -247,104 +274,76 @@ def adjust_timestamp(ts: datetime) -> datetime:
         return ts - timedelta(hours=5)
     return ts
 
+def attach_adjusted_timestamps(calls: List[Dict]):
+    """Adjust each call's timestamp once; reused by sort keys and loops."""
+    for call in calls:
+        if '_adj_ts' not in call:
+            call['_adj_ts'] = (adjust_timestamp(call['timestamp'])
+                               if call['timestamp'] else datetime.min)
+
 def export_to_csv(calls: List[Dict], filename: str = 'call_history.csv'):
     """Export call records to CSV file with enhanced formatting and statistics"""
-    # Track date ranges per number
-    number_dates = defaultdict(lambda: {
-        'first': None, 
-        'last': None, 
-        'count': 0
-    })
-    
-    # Process calls to get date ranges and call details
-    for call in calls:
-        number = call['number'] if call['number'] else 'Unknown'
-        if call['timestamp']:
-            adjusted_ts = adjust_timestamp(call['timestamp'])
-            if (number_dates[number]['first'] is None or 
-                adjusted_ts < number_dates[number]['first']):
-                number_dates[number]['first'] = adjusted_ts
-            if (number_dates[number]['last'] is None or 
-                adjusted_ts > number_dates[number]['last']):
-                number_dates[number]['last'] = adjusted_ts
-            number_dates[number]['count'] += 1
-    
-    # Define CSV headers in specified order
-    headers = [
-        'Phone Number',
-        'Call Timestamp',
-        'First Call',
-        'Last Call',
-        'Call Count',
-        'Call Type',
-        'Service'
-    ]
-    
+    attach_adjusted_timestamps(calls)
+
     try:
-        # Pre-process calls for statistics
-        number_stats = defaultdict(lambda: {
-            'count': 0,
-            'types': defaultdict(int)
+        # One DataFrame replaces the date-range, stats, and writer loops
+        df = pd.DataFrame(calls)
+        df['number'] = df['number'].fillna('Unknown')
+
+        # Adjusted timestamps as a real datetime column; NaT where missing
+        df['_ts'] = pd.to_datetime(df['_adj_ts'].where(df['timestamp'].notna()),
+                                   errors='coerce')
+
+        # First/last call and total count per number in C-level groupbys
+        agg = df.groupby('number')['_ts'].agg(first_call='min', last_call='max')
+        agg['call_count'] = df.groupby('number').size()
+
+        out = (df.sort_values('_ts', na_position='first')
+                 .merge(agg, left_on='number', right_index=True, how='left'))
+
+        fmt = '%Y-%m-%d %H:%M:%S'
+        result = pd.DataFrame({
+            'Phone Number': out['number'].map(standardize_phone_number),
+            'Call Timestamp': out['_ts'].dt.strftime(fmt).fillna(''),
+            'First Call': out['first_call'].dt.strftime(fmt).fillna(''),
+            'Last Call': out['last_call'].dt.strftime(fmt).fillna(''),
+            'Call Count': out['call_count'],
+            'Call Type': out['type'].fillna(''),
+            'Service': out['service'].fillna(''),
         })
-        
-        for call in calls:
-            number = call['number'] if call['number'] else 'Unknown'
-            number_stats[number]['count'] += 1
-            if call['type']:
-                number_stats[number]['types'][call['type']] += 1
-
-        # Sort calls by adjusted timestamp
-        sorted_calls = sorted(calls, key=lambda x: adjust_timestamp(x['timestamp']) if x['timestamp'] else datetime.min)
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            
-            for call in sorted_calls:
-                number = call['number'] if call['number'] else 'Unknown'
-                
-                # Format phone number with + prefix
-                formatted_number = standardize_phone_number(number)
-
-                # Format timestamps
-                current_timestamp = ''
-                if call['timestamp']:
-                    adjusted_ts = adjust_timestamp(call['timestamp'])
-                    current_timestamp = adjusted_ts.strftime('%Y-%m-%d %H:%M:%S')
-
-                writer.writerow({
-                    'Phone Number': formatted_number,
-                    'Call Timestamp': current_timestamp,
-                    'First Call': number_dates[number]['first'].strftime('%Y-%m-%d %H:%M:%S') if number_dates[number]['first'] else '',
-                    'Last Call': number_dates[number]['last'].strftime('%Y-%m-%d %H:%M:%S') if number_dates[number]['last'] else '',
-                    'Call Count': number_stats[number]['count'],
-                    'Call Type': call['type'] if call['type'] else '',
-                    'Service': call['service'] if call['service'] else ''
-                })
+        result.to_csv(filename, index=False)
 
         print(f"\nExported {len(calls)} records to {filename}")
-        
+
     except Exception as e:
         print(f"Error exporting to CSV: {e}")
 
-def analyze_plists(data: bytes):
+def find_bplist_positions(data: bytes) -> List[int]:
+    """Find all bplist00 marker offsets with one C-level scan."""
+    positions = []
+    pos = data.find(b'bplist00')
+    while pos != -1:
+        positions.append(pos)
+        pos = data.find(b'bplist00', pos + 8)
+    return positions
+
+def analyze_plists(data: bytes, positions: List[int] = None):
     """Analyze binary plists in the data"""
-    # Find all bplist markers
-    bplist_positions = [i for i in range(len(data)) if data[i:i+8] == b'bplist00']
-    
+    # Find all bplist markers unless the caller already scanned
+    bplist_positions = positions if positions is not None else find_bplist_positions(data)
+
     print(f"\nBinary Plist Analysis:")
     print(f"Total bplist markers found: {len(bplist_positions)}")
-    
+
     if bplist_positions:
         print("\nFirst 5 bplist positions:", bplist_positions[:5])
-        
-        # Analyze gaps between plists
-        gaps = [bplist_positions[i+1] - bplist_positions[i] 
-                for i in range(len(bplist_positions)-1)]
-        if gaps:
-            print(f"\nAverage gap between plists: {sum(gaps)/len(gaps):.0f} bytes")
-            print(f"Smallest gap: {min(gaps)} bytes")
-            print(f"Largest gap: {max(gaps)} bytes")
+
+        # Analyze gaps between plists in one vector pass
+        gaps = np.diff(np.asarray(bplist_positions))
+        if gaps.size:
+            print(f"\nAverage gap between plists: {gaps.mean():.0f} bytes")
+            print(f"Smallest gap: {gaps.min()} bytes")
+            print(f"Largest gap: {gaps.max()} bytes")
         
         # Analyze first few plists
         for i, pos in enumerate(bplist_positions[:3]):
@@ -356,22 +355,21 @@ def analyze_plists(data: bytes):
             print(f"Header: {data[pos:pos+20].hex()}")
 
 def main():
-    # Open and convert the log file to hex
-    with open('1F4D44A7-1B7A-4EB8-8B91-48C01F4F4573.log', 'rb') as f:
-        raw_data = f.read()
-        print(f"\nRaw data size: {len(raw_data)} bytes")
-        
-        hex_data = binascii.hexlify(raw_data)
-        print(f"Hex data size: {len(hex_data)} bytes")
-        
-        # Convert back to bytes for processing
-        processed_data = binascii.unhexlify(hex_data)
-        
+    # Memory-map the log; scans read pages on demand instead of copying
+    # the whole file into a bytes object up front
+    with open('1F4D44A7-1B7A-4EB8-8B91-48C01F4F4573.log', 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as processed_data:
+        print(f"\nRaw data size: {len(processed_data)} bytes")
+        print(f"Hex data size: {len(processed_data) * 2} bytes")
+
+        # Scan for plist markers once and share the offsets
+        bplist_positions = find_bplist_positions(processed_data)
+
         # Analyze binary plists
-        analyze_plists(processed_data)
-        
-    print("\nAnalyzing Call History Records:")
-    metadata = extract_call_metadata(processed_data)
+        analyze_plists(processed_data, bplist_positions)
+
+        print("\nAnalyzing Call History Records:")
+        metadata = extract_call_metadata(processed_data, bplist_positions)
     
     # Print summary statistics
     total_calls = len(metadata['calls'])
@@ -381,14 +379,15 @@ def main():
         print(f"  {stat.title()}: {count}")
     
     # Sort calls by timestamp in descending order (most recent first)
-    sorted_calls = sorted(metadata['calls'], 
-                         key=lambda x: adjust_timestamp(x['timestamp']) if x['timestamp'] else datetime.min,
+    attach_adjusted_timestamps(metadata['calls'])
+    sorted_calls = sorted(metadata['calls'],
+                         key=operator.itemgetter('_adj_ts'),
                          reverse=True)
-    
+
     # Print earliest and latest timestamps
     if sorted_calls:
-        latest = adjust_timestamp(sorted_calls[0]['timestamp'])
-        earliest = adjust_timestamp(sorted_calls[-1]['timestamp'])
+        latest = sorted_calls[0]['_adj_ts']
+        earliest = sorted_calls[-1]['_adj_ts']
         print(f"\nDate Range: {earliest.strftime('%Y-%m-%d %H:%M:%S')} to {latest.strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Print all call records
@@ -401,8 +400,7 @@ def main():
             print(f"Name: {call['name']}")
         if call['timestamp']:
             # Format timestamp as YYYY-MM-DD HH:MM:SS with timezone adjustment
-            adjusted_ts = adjust_timestamp(call['timestamp'])
-            print(f"Time: {adjusted_ts.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"Time: {call['_adj_ts'].strftime('%Y-%m-%d %H:%M:%S')}")
         if call['duration']:
             # Convert duration to HH:MM:SS format
             duration_secs = int(call['duration'])
@@ -1,36 +1,73 @@
-import csv
+import os
+import re
+from functools import lru_cache
 from typing import List, Dict
 
+import pandas as pd
+
+try:
+    # Arrow's multithreaded CSV reader and compute kernels, when installed
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Compiled once; sub runs the digit stripping in C
+_NON_DIGIT_RE = re.compile(r'\D')
+
+@lru_cache(maxsize=None)
 def standardize_phone_number(number: str) -> str:
-    """Standardize phone number to +XXXXXXXXXX format"""
+    """Standardize phone number to +XXXXXXXXXX format.
+
+    Cached: call logs repeat the same numbers heavily, so repeats cost
+    one dict lookup.
+    """
     if not number or number == 'Unknown':
         return 'Unknown'
-    
-    # Strip all non-digit characters
-    digits = ''.join(filter(str.isdigit, number))
-    
-    # Add + prefix if not present
-    if not digits.startswith('+'):
-        return f"+{digits}"
-    return digits
+
+    # Already normalized: '+' followed by digits passes through untouched
+    if number.startswith('+') and number[1:].isascii() and number[1:].isdigit():
+        return number
+
+    # Strip all non-digit characters; the result can never contain '+',
+    # so the prefix is added unconditionally
+    return '+' + _NON_DIGIT_RE.sub('', number)
 
 def update_csv():
-    # Read the existing CSV file
-    rows = []
-    with open('itunes-calls.csv', 'r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        headers = reader.fieldnames
-        
-        for row in reader:
-            # Update phone number format
-            row['Phone Number'] = standardize_phone_number(row['Phone Number'])
-            rows.append(row)
-    
-    # Write back to the file with updated phone numbers
-    with open('itunes-calls.csv', 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(rows)
+    if HAS_PYARROW:
+        # Read, normalize and write entirely in Arrow's native code paths
+        table = pa_csv.read_csv(
+            'itunes-calls.csv',
+            convert_options=pa_csv.ConvertOptions(
+                column_types={'Phone Number': 'string'}))
+        s = pc.cast(table['Phone Number'], 'string')
+        digits = pc.replace_substring_regex(s, r'\D', '')
+        cleaned = pc.binary_join_element_wise('+', digits, '')
+        mask = pc.or_(pc.equal(s, ''), pc.equal(s, 'Unknown'))
+        mask = pc.or_kleene(mask, pc.is_null(s))
+        normalized = pc.if_else(mask, 'Unknown', cleaned)
+        table = table.set_column(
+            table.schema.get_field_index('Phone Number'),
+            'Phone Number', normalized)
+        pa_csv.write_csv(table, 'itunes-calls.csv.tmp')
+        os.replace('itunes-calls.csv.tmp', 'itunes-calls.csv')
+        return
+
+    # Normalize chunk by chunk so memory stays flat on huge logs
+    first = True
+    for chunk in pd.read_csv('itunes-calls.csv', dtype=str,
+                             keep_default_na=False, chunksize=50_000):
+        s = chunk['Phone Number']
+        mask_unknown = (s == '') | (s == 'Unknown')
+        cleaned = '+' + s.str.replace(r'\D', '', regex=True)
+        chunk['Phone Number'] = cleaned.where(~mask_unknown, 'Unknown')
+        chunk.to_csv('itunes-calls.csv.tmp', mode='w' if first else 'a',
+                     header=first, index=False)
+        first = False
+
+    # Atomic swap so a crash mid-write never clobbers the original
+    os.replace('itunes-calls.csv.tmp', 'itunes-calls.csv')
 
 if __name__ == '__main__':
     update_csv()
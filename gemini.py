@@ -2,43 +2,32 @@ import struct
 import csv
 from datetime import datetime, timedelta
 import logging
+import mmap
 import re
-import uuid
 import json
 
+import numpy as np
+
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-def find_next_record(data: bytes, start: int) -> tuple[int, int]:
-    """Find the next record boundaries."""
-    try:
-        # Find start of record
-        pos = data.find(b'CHTransaction', start)
-        if pos == -1:
-            return -1, -1
-            
-        # Find end of record (next CHTransaction or end of file)
-        next_pos = data.find(b'CHTransaction', pos + 12)
-        if next_pos == -1:
-            next_pos = len(data)
-            
-        return pos, next_pos
-    except Exception as e:
-        logger.error(f"Error finding record boundaries: {e}")
-        return -1, -1
+# Timestamp decoder, parsed from its format string once at import
+_TS_DOUBLE = struct.Struct('>d')
+
+# Record field patterns, compiled once at import
+_UUID_RE = re.compile(
+    rb'([0-9A-F]{8}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{12})',
+    re.IGNORECASE)
+_PHONE_RE = re.compile(rb'\+\d{10,}')
 
 def extract_uuid(data: bytes) -> str:
     """Extract UUID from data."""
     try:
-        pattern = rb'([0-9A-F]{8}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{12})'
-        match = re.search(pattern, data, re.IGNORECASE)
+        # The pattern already guarantees a well-formed 8-4-4-4-12 string,
+        # so no round trip through uuid.UUID is needed
+        match = _UUID_RE.search(data)
         if match:
-            uuid_str = match.group(1).decode('utf-8')
-            try:
-                uuid.UUID(uuid_str)
-                return uuid_str
-            except:
-                pass
+            return match.group(1).decode('utf-8')
         return None
     except Exception as e:
         logger.error(f"Error extracting UUID: {e}")
@@ -47,12 +36,11 @@ def extract_uuid(data: bytes) -> str:
 def extract_phone_number(data, pos):
     """Extract phone number from data."""
     try:
-        # Look for phone number pattern
-        phone_pattern = rb'\+\d{10,}'
-        for i in range(pos, min(pos + 200, len(data))):
-            match = re.search(phone_pattern, data[i:i+20])
-            if match:
-                return match.group(0).decode('utf-8')
+        # One anchored search over the 200-byte window; pos/endpos bound
+        # the scan without copying out a slice per byte offset
+        match = _PHONE_RE.search(data, pos, min(pos + 200, len(data)))
+        if match:
+            return match.group(0).decode('ascii')
         return None
     except Exception as e:
         logger.error(f"Error extracting phone number: {e}")
@@ -64,113 +52,114 @@ def extract_timestamp(data: bytes) -> datetime:
         # Look for WNS.time# marker
         pos = data.find(b'WNS.time#')
         if pos != -1:
-            # Skip the WNS.time# prefix and read 8 bytes
-            timestamp_bytes = data[pos+9:pos+17]
-            if len(timestamp_bytes) == 8:
-                timestamp = struct.unpack('>d', timestamp_bytes)[0]
+            # Skip the WNS.time# prefix and read 8 bytes in place
+            if pos + 17 <= len(data):
+                (timestamp,) = _TS_DOUBLE.unpack_from(data, pos + 9)
                 return datetime(2001, 1, 1) + timedelta(seconds=timestamp)
         return None
     except Exception as e:
         logger.error(f"Error extracting timestamp: {e}")
         return None
 
+# Candidate duration encodings, in the order they are tried at each offset
+_DURATION_DTYPES = ('<u4', '<f4', '>u4', '>f4')
+
+def _values_at_offsets(buf, dtype):
+    """Interpret buf as dtype at every byte offset via four strided views."""
+    n = buf.size
+    vals = np.empty(n - 3, dtype=dtype)
+    for shift in range(4):
+        vals[shift::4] = buf[shift:shift + ((n - shift) // 4) * 4].view(dtype)
+    return vals
+
 def extract_duration(data, pos):
     """Extract call duration in seconds from data."""
     try:
-        # Look for duration value in NSKeyedArchiver plist
-        # Duration is often stored as a number after 'duration' key
-        for i in range(pos, min(pos + 500, len(data))):
-            # Look for duration value in binary format
-            # Try little-endian 32-bit integer
-            try:
-                val = struct.unpack('<I', data[i:i+4])[0]
-                if 1 <= val <= 7200:  # Between 1 second and 2 hours
-                    return float(val)
-            except:
-                pass
-                
-            # Try little-endian 32-bit float
-            try:
-                val = struct.unpack('<f', data[i:i+4])[0]
-                if 1.0 <= val <= 7200.0:  # Between 1 second and 2 hours
-                    return float(val)
-            except:
-                pass
-                
-            # Try big-endian 32-bit integer
-            try:
-                val = struct.unpack('>I', data[i:i+4])[0]
-                if 1 <= val <= 7200:  # Between 1 second and 2 hours
-                    return float(val)
-            except:
-                pass
-                
-            # Try big-endian 32-bit float
-            try:
-                val = struct.unpack('>f', data[i:i+4])[0]
-                if 1.0 <= val <= 7200.0:  # Between 1 second and 2 hours
-                    return float(val)
-            except:
-                pass
-                
-        return 0  # Default if no valid duration found
+        # Look for duration value in NSKeyedArchiver plist.
+        # Instead of struct-unpacking four candidate encodings per byte,
+        # decode the whole window as each encoding at once and mask for
+        # values between 1 second and 2 hours.
+        if pos + 4 > len(data):
+            # Out-of-range offsets are a silent no-op, matching the old
+            # per-byte loop (frombuffer would raise and log instead)
+            return 0
+        buf = np.frombuffer(data, dtype=np.uint8, offset=pos,
+                            count=min(503, len(data) - pos))
+
+        candidates = [_values_at_offsets(buf, dt) for dt in _DURATION_DTYPES]
+        masks = [(v >= 1) & (v <= 7200) for v in candidates]
+        hits = np.flatnonzero(masks[0] | masks[1] | masks[2] | masks[3])
+        if hits.size == 0:
+            return 0  # Default if no valid duration found
+
+        # Earliest offset wins; at that offset keep the original precedence
+        first = hits[0]
+        for mask, vals in zip(masks, candidates):
+            if mask[first]:
+                return float(vals[first])
+        return 0
     except Exception as e:
         logger.error(f"Error extracting duration: {e}")
         return 0
 
 def process_file(filename):
     try:
-        # Read the file
+        # Map the file instead of copying it into a bytes object; the
+        # scan below only ever touches it through find() and slicing
         logger.info(f"Reading file: {filename}")
-        with open(filename, 'rb') as f:
-            data = f.read()
-            
-        records = []
-        pos = 0
-        seen_uuids = set()  # Track unique UUIDs
-        
-        # Process each record
-        while True:
-            # Find next record
-            start, end = find_next_record(data, pos)
-            if start == -1:
-                break
-                
-            # Extract record data
-            record_data = data[start:end]
-            
-            # Parse record fields
-            record = {
-                'uuid': extract_uuid(record_data),
-                'caller_id': extract_phone_number(record_data, start),
-                'timestamp': extract_timestamp(record_data),
-                'duration': extract_duration(record_data, start)
-            }
-            
-            # Determine call type
-            if b'com.apple.Telephony' in record_data:
-                record['call_type'] = 'cellular'
-            elif b'com.apple.FaceTime' in record_data:
-                record['call_type'] = 'facetime'
-            else:
-                record['call_type'] = 'unknown'
-                
-            # Validate record and check for duplicate UUIDs
-            if record['uuid'] and record['timestamp']:
-                if record['uuid'] not in seen_uuids:
-                    seen_uuids.add(record['uuid'])
-                    records.append(record)
-                else:
-                    logger.warning(f"Duplicate UUID found: {record['uuid']}")
-                
-            pos = end
-            
+        with open(filename, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(data, 'madvise'):
+                # We walk the file front to back; let the kernel read ahead
+                data.madvise(mmap.MADV_SEQUENTIAL)
+
+            records = process_records(data)
         logger.info(f"Found {len(records)} records with unique UUIDs")
         return records
     except Exception as e:
         logger.error(f"Error processing file: {e}")
         return []
 
+def process_records(data):
+    """Scan mapped file data and parse each CHTransaction record."""
+    records = []
+    seen_uuids = set()  # Track unique UUIDs
+
+    # Collect every record boundary in one pass; each marker both opens
+    # a record and closes the previous one, with EOF closing the last
+    bounds = [m.start() for m in re.finditer(b'CHTransaction', data)]
+    bounds.append(len(data))
+
+    for start, end in zip(bounds, bounds[1:]):
+        # Extract record data
+        record_data = data[start:end]
+
+        # Parse record fields
+        record = {
+            'uuid': extract_uuid(record_data),
+            'caller_id': extract_phone_number(record_data, start),
+            'timestamp': extract_timestamp(record_data),
+            'duration': extract_duration(record_data, start)
+        }
+
+        # Determine call type
+        if b'com.apple.Telephony' in record_data:
+            record['call_type'] = 'cellular'
+        elif b'com.apple.FaceTime' in record_data:
+            record['call_type'] = 'facetime'
+        else:
+            record['call_type'] = 'unknown'
+
+        # Validate record and check for duplicate UUIDs
+        if record['uuid'] and record['timestamp']:
+            if record['uuid'] not in seen_uuids:
+                seen_uuids.add(record['uuid'])
+                records.append(record)
+            else:
+                logger.warning(f"Duplicate UUID found: {record['uuid']}")
+
+    return records
+
 def export_to_csv(records, output_file='call_history.csv'):
     if not records:
         logger.warning("No records to export")
@@ -1,5 +1,6 @@
 import biplist
 import io
+import mmap
 import re
 import struct
 import uuid
@@ -348,35 +349,40 @@ def main():
             logging.info("Successfully processed SQLite database")
             return
             
-        # If SQLite fails, try reading as binary file
-        with open("CallHistory.storedata", "rb") as f:
-            data = f.read()
-            
-        # Find all binary plist chunks
-        chunks = []
-        offset = 0
-        while True:
-            idx = data.find(b'bplist00', offset)
-            if idx == -1:
-                break
-                
-            # Look for the next marker or end of file
-            next_idx = data.find(b'bplist00', idx + 8)
-            if next_idx == -1:
-                chunk = data[idx:]
-            else:
-                chunk = data[idx:next_idx]
-                
-            # Clean the chunk
-            chunk = clean_bplist_chunk(chunk)
-            
-            if len(chunk) > 8:  # Must be longer than 'bplist00'
-                chunks.append(chunk)
-                
-            if next_idx == -1:
-                break
-            offset = idx + 8
-            
+        # If SQLite fails, scan the file as a read-only mapping rather
+        # than copying it all into memory; slicing still yields bytes
+        with open("CallHistory.storedata", "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(data, 'madvise'):
+                # The marker scan walks front to back
+                data.madvise(mmap.MADV_SEQUENTIAL)
+
+            # Find all binary plist chunks
+            chunks = []
+            offset = 0
+            while True:
+                idx = data.find(b'bplist00', offset)
+                if idx == -1:
+                    break
+
+                # Look for the next marker or end of file
+                next_idx = data.find(b'bplist00', idx + 8)
+                if next_idx == -1:
+                    chunk = data[idx:]
+                else:
+                    chunk = data[idx:next_idx]
+
+                # Clean the chunk
+                chunk = clean_bplist_chunk(chunk)
+
+                if len(chunk) > 8:  # Must be longer than 'bplist00'
+                    chunks.append(chunk)
+
+                if next_idx == -1:
+                    break
+                offset = idx + 8
+
+
         logging.info(f"Found {len(chunks)} potential plist chunks")
         
         decoded_records = []